@@ -96,7 +96,7 @@ def list_all_users(data_dir: Path | None = None) -> list[tuple[str, bool, str |
         conn.close()
 
 
-def hash_password_for_storage(password: str, username: str) -> str:
+def hash_password_for_storage(password: str, username: str, fast: bool = False) -> str:
     """Hash password for storage, matching the browser→server flow.
 
     The web app uses two-stage hashing:
@@ -104,6 +104,10 @@ def hash_password_for_storage(password: str, username: str) -> str:
     2. Server applies Argon2 to the SHA256 hash
 
     This function replicates both stages for CLI user creation.
+
+    With fast=True, Argon2 runs with its minimum cost. The parameters are
+    stored in the hash, so the server's login check is cheap too. Only use
+    it for throwaway test users.
     """
     import hashlib
 
@@ -114,7 +118,10 @@ def hash_password_for_storage(password: str, username: str) -> str:
     # Stage 2: Server-side Argon2
     try:
         from argon2 import PasswordHasher
-        ph = PasswordHasher()
+        if fast:
+            ph = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+        else:
+            ph = PasswordHasher()
         return ph.hash(client_hash)
     except ImportError:
         raise click.ClickException(
@@ -1301,7 +1308,8 @@ def create_test_user(username: str, password: str, scenario: str | None, data_di
     """Create a test user with optional scenario in one command.
 
     Combines create-user, create-scenario, and use into a single operation.
-    Designed for E2E test fixtures that need quick user setup.
+    Designed for E2E test fixtures that need quick user setup, so the password
+    is stored with minimum-cost Argon2 parameters.
 
     Examples:
         db-manager create-test-user _test_alice
@@ -1331,7 +1339,7 @@ def create_test_user(username: str, password: str, scenario: str | None, data_di
             click.echo(f"User '{username}' already exists, skipping creation")
         else:
             # Create user in auth database
-            password_hash = hash_password_for_storage(password, username)
+            password_hash = hash_password_for_storage(password, username, fast=True)
             now = datetime.now().isoformat()
             conn.execute(
                 """INSERT INTO users (username, password_hash, created_at, is_guest, last_activity_at)
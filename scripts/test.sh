@@ -210,8 +210,9 @@ run_integration_tests() {
     # Ensure dependencies are installed (--group dev for pytest)
     uv sync --quiet --group dev 2>&1 || true
 
-    # Run with parallel workers, grouped by file to reduce fixture setup overhead
-    uv run pytest tests/ -v --tb=short -n auto --dist loadfile 2>&1 || INTEGRATION_RESULT=1
+    # Parallel workers come from addopts (-n auto --dist=loadgroup): modules that
+    # share users stay on one worker via xdist_group, all other tests spread out
+    uv run pytest tests/ -v --tb=short 2>&1 || INTEGRATION_RESULT=1
 
     INTEGRATION_TIME=$((SECONDS - start_time))
 
@@ -140,6 +140,22 @@ pub struct AdminContext {
 }
 
 impl AdminContext {
+    /// Admin guard: accept an authenticated user only if they are an admin.
+    /// Non-admins get 403 Forbidden.
+    pub fn from_auth(auth: AuthContext) -> Result<Self, Response> {
+        if !auth.is_admin {
+            return Err((StatusCode::FORBIDDEN, "Admin access required").into_response());
+        }
+
+        Ok(AdminContext {
+            user_id: auth.user_id,
+            username: auth.username,
+            user_db: auth.user_db,
+            has_vocab_access: auth.has_vocab_access,
+            has_grammar_access: auth.has_grammar_access,
+        })
+    }
+
     /// Convert to regular AuthContext (is_admin is always true)
     pub fn into_auth_context(self) -> AuthContext {
         AuthContext {
@@ -164,18 +180,7 @@ impl FromRequestParts<AppState> for AdminContext {
         let auth = AuthContext::from_request_parts(parts, state).await?;
 
         // Check admin status BEFORE any form parsing
-        if !auth.is_admin {
-            // Return 403 Forbidden for non-admin users
-            return Err((StatusCode::FORBIDDEN, "Admin access required").into_response());
-        }
-
-        Ok(AdminContext {
-            user_id: auth.user_id,
-            username: auth.username,
-            user_db: auth.user_db,
-            has_vocab_access: auth.has_vocab_access,
-            has_grammar_access: auth.has_grammar_access,
-        })
+        AdminContext::from_auth(auth)
     }
 }
 
@@ -197,3 +202,32 @@ impl FromRequestParts<AppState> for OptionalAuth {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn auth_context(is_admin: bool) -> AuthContext {
+        AuthContext {
+            user_id: 1,
+            username: "someone".to_string(),
+            is_admin,
+            user_db: Arc::new(Mutex::new(Connection::open_in_memory().unwrap())),
+            has_vocab_access: false,
+            has_grammar_access: false,
+        }
+    }
+
+    #[test]
+    fn test_admin_guard_rejects_non_admin() {
+        let rejection = AdminContext::from_auth(auth_context(false)).err().unwrap();
+        assert_eq!(rejection.status(), StatusCode::FORBIDDEN);
+    }
+
+    #[test]
+    fn test_admin_guard_accepts_admin() {
+        let admin = AdminContext::from_auth(auth_context(true)).ok().unwrap();
+        assert_eq!(admin.user_id, 1);
+        assert!(admin.into_auth_context().is_admin);
+    }
+}
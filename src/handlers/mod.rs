@@ -10,8 +10,11 @@ pub mod study;
 pub mod vocabulary;
 
 use askama::Template;
+use axum::http::StatusCode;
 use axum::response::Html;
+use axum::Json;
 use chrono::{DateTime, Utc};
+use rusqlite::Connection;
 
 use axum::extract::State;
 
@@ -65,6 +68,57 @@ pub struct IndexTemplate {
   pub nav: NavContext,
 }
 
+/// Study counters shown on the home page
+#[derive(serde::Serialize)]
+pub struct HomeCounts {
+  pub due_count: i64,
+  pub unreviewed_count: i64, // Cards not reviewed today (accelerated mode)
+  pub accelerated_mode: bool,
+  pub freeze_introductions: bool,
+  pub next_review_timestamp: Option<i64>, // Unix timestamp in seconds of the next upcoming review
+}
+
+/// Compute the home page counters (shared by `index` and `home_summary`)
+fn home_counts(conn: &Connection, app_conn: &Connection, user_id: i64) -> HomeCounts {
+  let accelerated_mode = db::get_all_tiers_unlocked(conn).log_warn_default("Failed to get all_tiers_unlocked");
+
+  // Get remaining new card slots for today (respects daily limit + freeze toggle)
+  let freeze_introductions = db::is_introductions_frozen(conn).unwrap_or(false);
+  let remaining_new_slots = if freeze_introductions {
+    0
+  } else {
+    db::get_remaining_new_card_slots(conn).unwrap_or(u32::MAX)
+  };
+  let can_add_new = remaining_new_slots > 0;
+
+  // Use filtered counts to include vocabulary pack cards (with permission check)
+  // Use get_due_count_with_new_limit to cap new cards at daily limit remaining
+  let filter = db::StudyFilterMode::All;
+  let due_count = db::get_due_count_with_new_limit(conn, app_conn, user_id, &filter, remaining_new_slots)
+    .log_warn_default("Failed to get due count");
+  let unreviewed_count = if accelerated_mode && can_add_new {
+    db::get_unreviewed_today_count_filtered(conn, app_conn, user_id, &filter).log_warn_default("Failed to get unreviewed count")
+  } else {
+    0
+  };
+
+  // Always fetch next upcoming review time (for cards not yet due)
+  // This allows the UI to show a countdown even when there are cards currently due
+  // Uses filtered version to include vocabulary pack cards (matches due_count logic)
+  let next_review_timestamp = db::get_next_upcoming_review_time_filtered(conn, app_conn, user_id, &filter)
+    .log_warn("Failed to get next review time")
+    .flatten()
+    .map(|dt| dt.timestamp());
+
+  HomeCounts {
+    due_count,
+    unreviewed_count,
+    accelerated_mode,
+    freeze_introductions,
+    next_review_timestamp,
+  }
+}
+
 fn format_relative_time(dt: DateTime<Utc>) -> String {
   let now = Utc::now();
   let duration = dt.signed_duration_since(now);
@@ -120,40 +174,21 @@ pub async fn index(State(state): State<AppState>, auth: AuthContext) -> Html<Str
     });
   }
 
-  let accelerated_mode = db::get_all_tiers_unlocked(&conn).log_warn_default("Failed to get all_tiers_unlocked");
-
-  // Get remaining new card slots for today (respects daily limit + freeze toggle)
-  let freeze_introductions = db::is_introductions_frozen(&conn).unwrap_or(false);
-  let remaining_new_slots = if freeze_introductions {
-    0
-  } else {
-    db::get_remaining_new_card_slots(&conn).unwrap_or(u32::MAX)
-  };
-  let can_add_new = remaining_new_slots > 0;
+  let HomeCounts {
+    due_count,
+    unreviewed_count,
+    accelerated_mode,
+    freeze_introductions,
+    next_review_timestamp,
+  } = home_counts(&conn, &app_conn, auth.user_id);
 
-  // Use filtered counts to include vocabulary pack cards (with permission check)
-  // Use get_due_count_with_new_limit to cap new cards at daily limit remaining
-  let filter = db::StudyFilterMode::All;
-  let due_count = db::get_due_count_with_new_limit(&conn, &app_conn, auth.user_id, &filter, remaining_new_slots)
-    .log_warn_default("Failed to get due count");
-  let unreviewed_count = if accelerated_mode && can_add_new {
-    db::get_unreviewed_today_count_filtered(&conn, &app_conn, auth.user_id, &filter).log_warn_default("Failed to get unreviewed count")
-  } else {
-    0
-  };
   // Get accessible card counts (only cards user can actually study)
   let (total_cards, cards_learned) = db::get_accessible_card_count(&conn, &app_conn, auth.user_id)
     .log_warn_default("Failed to get accessible card count");
 
-  // Always fetch next upcoming review time (for cards not yet due)
-  // This allows the UI to show a countdown even when there are cards currently due
-  // Uses filtered version to include vocabulary pack cards (matches due_count logic)
-  let next_review_time = db::get_next_upcoming_review_time_filtered(&conn, &app_conn, auth.user_id, &filter)
-    .log_warn("Failed to get next review time")
-    .flatten();
-
-  let next_review = next_review_time.map(format_relative_time);
-  let next_review_timestamp = next_review_time.map(|dt| dt.timestamp());
+  let next_review = next_review_timestamp
+    .and_then(|ts| DateTime::<Utc>::from_timestamp(ts, 0))
+    .map(format_relative_time);
 
   let template = IndexTemplate {
     due_count,
@@ -176,6 +211,18 @@ pub async fn index(State(state): State<AppState>, auth: AuthContext) -> Html<Str
   Html(template.render().unwrap_or_default())
 }
 
+/// Home page counters as JSON, for clients that only need the numbers.
+/// Unlike `index`, this does not run the auto-unlock checks.
+pub async fn home_summary(
+  State(state): State<AppState>,
+  auth: AuthContext,
+) -> Result<Json<HomeCounts>, StatusCode> {
+  let conn = auth.user_db.lock().map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+  let app_conn = state.auth_db.lock().map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+
+  Ok(Json(home_counts(&conn, &app_conn, auth.user_id)))
+}
+
 pub use diagnostic::log_diagnostic;
 pub use guide::guide;
 pub use library::{library_characters, library_index};
@@ -1,7 +1,7 @@
 //! User-facing settings page and preferences.
 
 use askama::Template;
-use axum::extract::{Multipart, State};
+use axum::extract::{Multipart, Query, State};
 use axum::http::{header, HeaderMap, StatusCode};
 use axum::response::{Html, IntoResponse, Redirect, Response};
 use axum::Form;
@@ -830,12 +830,21 @@ struct PackCardTemplate {
   users: Vec<UserDisplay>,
 }
 
+/// Query options for enabling a pack
+#[derive(Deserialize)]
+pub struct EnablePackQuery {
+  /// Also make the pack public (admins only), saving a separate make-public request
+  #[serde(default)]
+  pub public: bool,
+}
+
 /// Enable a card pack for the current user
 pub async fn enable_pack(
   auth: AuthContext,
   State(state): State<AppState>,
   headers: HeaderMap,
   AxumPath(pack_id): AxumPath<String>,
+  Query(query): Query<EnablePackQuery>,
 ) -> Response {
   #[cfg(feature = "profiling")]
   crate::profile_log!(EventType::HandlerStart {
@@ -941,6 +950,15 @@ pub async fn enable_pack(
         tracing::warn!("Failed to set pack {} globally enabled: {}", pack_id, e);
       }
 
+      // Optionally make the pack public in the same request
+      if query.public && auth.is_admin {
+        if let Err(e) = auth_db::set_pack_public(&app_conn, &pack_id, true) {
+          tracing::warn!("Failed to make pack {} public: {}", pack_id, e);
+        } else {
+          tracing::info!("Made pack {} public", pack_id);
+        }
+      }
+
       // Return HTMX partial or redirect
       if is_htmx_request(&headers) {
         let enabled_packs = Vec::new(); // Not used since we use is_globally_enabled now
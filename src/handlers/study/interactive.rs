@@ -2,12 +2,12 @@
 
 use askama::Template;
 use axum::extract::State;
-use axum::http::StatusCode;
+use axum::http::{header, HeaderMap, StatusCode};
 use axum::response::{Html, IntoResponse, Redirect, Response};
-use axum::Form;
+use axum::{Form, Json};
 use chrono::Utc;
 use rusqlite::params;
-use serde::Deserialize;
+use serde::{Deserialize, Serialize};
 
 use crate::auth::AuthContext;
 use crate::db::{self, LogOnError};
@@ -30,10 +30,43 @@ use super::{
   get_tracked_character, is_korean,
 };
 
+/// Selected study card, returned instead of HTML when the request accepts JSON
+#[derive(Debug, Serialize)]
+pub struct StudyCardJson {
+  pub session_id: String,
+  /// None when no card is available
+  pub card_id: Option<i64>,
+  pub front: Option<String>,
+  pub is_reverse: Option<bool>,
+  /// Failed cards still waiting to be shown again in this session
+  pub reinforcement_queue: Vec<i64>,
+}
+
+impl StudyCardJson {
+  fn new(session_id: String, reinforcement_queue: Vec<i64>, card: Option<&Card>) -> Self {
+    Self {
+      session_id,
+      card_id: card.map(|c| c.id),
+      front: card.map(|c| c.front.clone()),
+      is_reverse: card.map(|c| c.is_reverse),
+      reinforcement_queue,
+    }
+  }
+}
+
+/// Whether the client asked for the JSON card payload instead of the page
+fn wants_json(headers: &HeaderMap) -> bool {
+  headers
+    .get(header::ACCEPT)
+    .and_then(|value| value.to_str().ok())
+    .is_some_and(|value| value.contains("application/json"))
+}
+
 /// Interactive study mode with input-based validation
 pub async fn study_start_interactive(
   State(state): State<AppState>,
   auth: AuthContext,
+  headers: HeaderMap,
 ) -> Response {
   #[cfg(feature = "profiling")]
   crate::profile_log!(EventType::HandlerStart {
@@ -153,10 +186,15 @@ pub async fn study_start_interactive(
   };
 
   // Save session state
+  let reinforcement_queue: Vec<i64> = study_session.reinforcement_queue.iter().copied().collect();
   session::update_session(&session_id, study_session);
 
   if let Some(card_id) = selected_card_id
     && let Ok(Some(card)) = db::get_card_by_id(&conn, card_id) {
+      if wants_json(&headers) {
+        return Json(StudyCardJson::new(session_id, reinforcement_queue, Some(&card))).into_response();
+      }
+
       let hint_gen = HintGenerator::new(&card.main_answer, card.description.as_deref());
 
       // Check if answer is Korean (needs multiple choice)
@@ -224,6 +262,10 @@ pub async fn study_start_interactive(
     return Redirect::to("/").into_response();
   }
 
+  if wants_json(&headers) {
+    return Json(StudyCardJson::new(session_id, reinforcement_queue, None)).into_response();
+  }
+
   let template = StudyInteractiveTemplate {
     card_id: 0,
     front: String::new(),
@@ -470,6 +512,7 @@ pub async fn validate_answer_handler(
 pub async fn next_card_interactive(
   State(state): State<AppState>,
   auth: AuthContext,
+  headers: HeaderMap,
   Form(form): Form<NextCardForm>,
 ) -> Response {
   #[cfg(feature = "profiling")]
@@ -513,10 +556,15 @@ pub async fn next_card_interactive(
   };
 
   // Save session state
+  let reinforcement_queue: Vec<i64> = study_session.reinforcement_queue.iter().copied().collect();
   session::update_session(&session_id, study_session);
 
   if let Some(card_id) = selected_card_id
     && let Ok(Some(next_card)) = db::get_card_by_id(&conn, card_id) {
+      if wants_json(&headers) {
+        return Json(StudyCardJson::new(session_id, reinforcement_queue, Some(&next_card))).into_response();
+      }
+
       let hint_gen = HintGenerator::new(&next_card.main_answer, next_card.description.as_deref());
 
       // Check if answer is Korean (needs multiple choice)
@@ -584,6 +632,10 @@ pub async fn next_card_interactive(
     return Redirect::to("/").into_response();
   }
 
+  if wants_json(&headers) {
+    return Json(StudyCardJson::new(session_id, reinforcement_queue, None)).into_response();
+  }
+
   let template = NoCardsTemplate { nav: NavContext::from_auth(&auth) };
   Html(template.render().unwrap_or_default()).into_response()
 }
@@ -188,6 +188,7 @@ async fn main() {
         .route("/reference/pack/{pack_id}/quick-reference", get(handlers::quick_reference))
         // API endpoint for service worker to get dynamic precache URLs
         .route("/api/precache-urls", get(handlers::precache_urls))
+        .route("/api/home/summary", get(handlers::home_summary))
         // Offline study mode API
         .route("/api/study/download-session", post(handlers::study::download_session))
         .route("/api/study/sync-offline", post(handlers::study::sync_session))
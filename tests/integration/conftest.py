@@ -8,14 +8,21 @@ This module provides fixtures for:
 - Database inspection utilities
 """
 
+import functools
 import hashlib
+import itertools
 import os
+import re
 import shutil
 import signal
+import sqlite3
 import subprocess
 import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 import httpx
 import pytest
@@ -24,10 +31,74 @@ import pytest
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 PY_SCRIPTS_DIR = PROJECT_ROOT / "py_scripts"
 
+
+def _test_data_dir_base() -> Path:
+    """Pick where the throwaway integration databases live.
+
+    KR_TEST_DATA_DIR wins if set. Otherwise use the /dev/shm tmpfs where the
+    OS has one (Linux), so SQLite writes never wait on the disk, and fall back
+    to data/test/integration under the project.
+    """
+    override = os.environ.get("KR_TEST_DATA_DIR")
+    if override:
+        return Path(override)
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm / "kr_notebook" / "test" / "integration"
+    return PROJECT_ROOT / "data" / "test" / "integration"
+
+
 # Base test data directory and port (workers get their own isolated subdirectories/ports)
-TEST_DATA_DIR_BASE = PROJECT_ROOT / "data" / "test" / "integration"
+TEST_DATA_DIR_BASE = _test_data_dir_base()
 TEST_PORT_BASE = 3100
 
+# One UUID per process (i.e. per xdist worker); a counter makes names unique within it
+_RUN_ID = uuid.uuid4().hex[:6]
+_name_counter = itertools.count()
+
+
+def unique_username(prefix: str = "_test_") -> str:
+    """Return a username that is unique within this test run."""
+    return f"{prefix}{_RUN_ID}_{next(_name_counter):04d}"
+
+
+# Signature of the user_factory fixture: (prefix, password) -> (username, password_hash)
+UserFactory = Callable[..., tuple[str, str]]
+ScenarioUser = Callable[[str], tuple[str, str]]
+
+
+# Matches the preset registrations in db-manager's CLI source
+_SCENARIO_PRESET_RE = re.compile(r'@_register_preset\(\s*"([^"]+)"')
+
+
+@functools.cache
+def available_scenarios() -> frozenset[str]:
+    """Scenario presets db-manager provides.
+
+    Read from its source rather than by running it, so collection stays
+    cheap; an unreadable source yields no presets.
+    """
+    cli_source = PY_SCRIPTS_DIR / "src" / "db_manager" / "cli.py"
+    try:
+        return frozenset(_SCENARIO_PRESET_RE.findall(cli_source.read_text()))
+    except OSError:
+        return frozenset()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked scenario(...) whose presets db-manager lacks.
+
+    The skip is decided at collection, so no user is created or server
+    request made for them.
+    """
+    for item in items:
+        for marker in item.iter_markers("scenario"):
+            missing = sorted(set(marker.args) - available_scenarios())
+            if missing:
+                item.add_marker(
+                    pytest.mark.skip(reason=f"Scenario preset not available: {', '.join(missing)}")
+                )
+
 
 def get_worker_id(request: pytest.FixtureRequest) -> str:
     """Get the xdist worker ID, or 'master' if not running under xdist."""
@@ -58,11 +129,14 @@ def get_worker_data_dir(worker_id: str) -> Path:
 
 
 def compute_password_hash(password: str, username: str) -> str:
-    """Compute client-side password hash (SHA-256 of password:username).
+    """Compute client-side password hash (SHA-256 of password:lowercased username).
 
-    This matches the authentication flow where client hashes password before sending.
+    This matches the authentication flow where client hashes password before
+    sending (static/js/auth.js), and the hash db-manager stores for the users
+    it creates. DbManager.create_user returns it, so fixtures need not call
+    this again for users they create.
     """
-    combined = f"{password}:{username}"
+    combined = f"{password}:{username.lower()}"
     return hashlib.sha256(combined.encode()).hexdigest()
 
 
@@ -75,6 +149,18 @@ class DbManager:
         self.project_root = project_root
         self.py_scripts_dir = project_root / "py_scripts"
         self.data_dir = data_dir
+        self._pending_deletes: list[str] = []
+
+    def connect(self, db_path: Path) -> sqlite3.Connection:
+        """Open one of the test databases for a direct read or write.
+
+        synchronous=NORMAL skips the fsync per commit; the files are thrown
+        away after the run, so durability against power loss doesn't matter.
+        Tests that seed data by hand should connect through here too.
+        """
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def _run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
         """Run db-manager with given arguments."""
@@ -87,28 +173,75 @@ class DbManager:
             check=check,
         )
 
-    def create_user(self, username: str, password: str = "test123") -> str:
-        """Create a test user and return the password hash for login."""
+    def create_user(
+        self, username: str, password: str = "test123", scenario: str | None = None
+    ) -> str:
+        """Create a test user and return the password hash for login.
+
+        With a scenario preset the user's learning.db starts in that state, in
+        the same db-manager call.
+        """
         # Use create-test-user which supports --data-dir
-        self._run("create-test-user", username, "--password", password)
+        args = ["create-test-user", username, "--password", password]
+        if scenario is not None:
+            args += ["--scenario", scenario]
+        self._run(*args)
         return compute_password_hash(password, username)
 
-    def delete_user(self, username: str) -> None:
-        """Delete a user and all their data."""
-        self._run("delete-user", username, "--yes", check=False)
+    def delete_users(self, usernames: list[str]) -> None:
+        """Delete several users and all their data in one go.
+
+        The app.db rows go in a single DELETE and no db-manager subprocess
+        is spawned.
+        """
+        if not usernames:
+            return
+
+        placeholders = ", ".join("?" * len(usernames))
+        with self.connect(self.data_dir / "app.db") as conn:
+            conn.execute(f"DELETE FROM users WHERE username IN ({placeholders})", usernames)
+
+        for username in usernames:
+            shutil.rmtree(self.data_dir / "users" / username, ignore_errors=True)
+            shutil.rmtree(self.data_dir / "scenarios" / username, ignore_errors=True)
+
+    def delete_user_later(self, username: str) -> None:
+        """Queue a user for deletion when the session ends.
+
+        Names are unique per run, so nothing else will reuse the user; the
+        test finishes without waiting for the cleanup.
+        """
+        self._pending_deletes.append(username)
+
+    def delete_pending_users(self) -> None:
+        """Delete every user queued by delete_user_later in one batch."""
+        self.delete_users(self._pending_deletes)
+        self._pending_deletes.clear()
 
     def user_exists(self, username: str) -> bool:
         """Check if a user exists."""
         result = self._run("list-users", check=False)
         return username in result.stdout
 
-    def create_scenario(self, username: str, preset: str) -> None:
-        """Create a test scenario for a user."""
-        self._run("create-scenario", preset, "--user", username)
+    def save_scenario(self, username: str, scenario: str) -> None:
+        """Snapshot a user's current learning.db as a named scenario."""
+        scenario_dir = self.data_dir / "scenarios" / username
+        scenario_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(
+            self.data_dir / "users" / username / "learning.db",
+            scenario_dir / f"{scenario}.db",
+        )
 
-    def use_scenario(self, username: str, scenario: str) -> None:
-        """Switch user to a scenario."""
-        self._run("use", scenario, "--user", username)
+    def restore_scenario(self, username: str, scenario: str) -> None:
+        """Copy a user's scenario database back over their learning.db.
+
+        Same result as db-manager's use command without spawning it or
+        writing a backup; the scenario must already exist.
+        """
+        shutil.copy2(
+            self.data_dir / "scenarios" / username / f"{scenario}.db",
+            self.data_dir / "users" / username / "learning.db",
+        )
 
     def get_group_count(self) -> int:
         """Get the total number of groups."""
@@ -157,9 +290,8 @@ class DbManager:
 
     def set_setting(self, username: str, key: str, value: str) -> None:
         """Set a user setting in their learning.db."""
-        import sqlite3
         learning_db = self.data_dir / "users" / username / "learning.db"
-        with sqlite3.connect(learning_db) as conn:
+        with self.connect(learning_db) as conn:
             conn.execute(
                 "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
                 (key, value)
@@ -168,10 +300,9 @@ class DbManager:
 
     def unlock_lesson(self, username: str, pack_id: str, lesson: int) -> None:
         """Unlock a lesson for a user in their learning.db."""
-        import sqlite3
         from datetime import datetime
         learning_db = self.data_dir / "users" / username / "learning.db"
-        with sqlite3.connect(learning_db) as conn:
+        with self.connect(learning_db) as conn:
             conn.execute(
                 """INSERT OR REPLACE INTO pack_lesson_progress (pack_id, lesson, unlocked, unlocked_at)
                    VALUES (?, ?, 1, ?)""",
@@ -181,10 +312,9 @@ class DbManager:
 
     def enable_pack_for_user(self, username: str, pack_id: str) -> None:
         """Enable a pack for a user by inserting into enabled_packs."""
-        import sqlite3
         from datetime import datetime
         learning_db = self.data_dir / "users" / username / "learning.db"
-        with sqlite3.connect(learning_db) as conn:
+        with self.connect(learning_db) as conn:
             conn.execute(
                 """INSERT OR REPLACE INTO enabled_packs (pack_id, enabled_at, cards_created, config)
                    VALUES (?, ?, 1, NULL)""",
@@ -197,12 +327,11 @@ class DbManager:
 
         Sets learning_step >= 4 to mark cards as graduated.
         """
-        import sqlite3
         from datetime import datetime, timedelta
         learning_db = self.data_dir / "users" / username / "learning.db"
         app_db = self.data_dir / "app.db"
 
-        with sqlite3.connect(learning_db) as conn:
+        with self.connect(learning_db) as conn:
             # Attach app.db to get card IDs
             conn.execute(f"ATTACH DATABASE '{app_db}' AS app")
 
@@ -225,6 +354,137 @@ class DbManager:
 
             conn.commit()
 
+    def mark_cards_reviewed(self, username: str, count: int) -> list[int]:
+        """Record a first review today for the first `count` tier 1 cards.
+
+        Equivalent to studying those cards through /study: each gets a
+        review_logs entry dated now (so it counts toward the daily new card
+        limit) and a card_progress row in the learning phase, due in 10 minutes.
+        All writes happen in one transaction. Returns the card IDs.
+        """
+        learning_db = self.data_dir / "users" / username / "learning.db"
+        app_db = self.data_dir / "app.db"
+
+        with self.connect(learning_db) as conn:
+            conn.execute(f"ATTACH DATABASE '{app_db}' AS app")
+            card_ids = [
+                card_id
+                for (card_id,) in conn.execute(
+                    """SELECT id FROM app.card_definitions
+                       WHERE pack_id IS NULL AND tier = 1
+                       ORDER BY id LIMIT ?""",
+                    (count,),
+                )
+            ]
+
+            now = datetime.now(timezone.utc)
+            reviewed_at = now.isoformat()
+            next_review = (now + timedelta(minutes=10)).isoformat()
+            conn.executemany(
+                """INSERT INTO review_logs (card_id, quality, reviewed_at, is_correct, study_mode)
+                   VALUES (?, 0, ?, 0, 'interactive')""",
+                [(card_id, reviewed_at) for card_id in card_ids],
+            )
+            conn.executemany(
+                """INSERT OR REPLACE INTO card_progress
+                   (card_id, next_review, total_reviews, learning_step, fsrs_state)
+                   VALUES (?, ?, 1, 1, 'Learning')""",
+                [(card_id, next_review) for card_id in card_ids],
+            )
+            conn.commit()
+
+        return card_ids
+
+    def seed_minimal_sibling_pair(self, username: str) -> tuple[int, int]:
+        """Leave exactly one forward/reverse tier 1 pair due for a user.
+
+        Every other card the user could be offered (tier 1 Hangul and any pack
+        card) gets a learning-phase card_progress row due in a week, so /study
+        can only offer the pair. The rows stay below graduation so tier 1
+        progress never reaches the auto-unlock threshold, which would redirect
+        /next-card to the home page. Returns (forward_id, reverse_id).
+        """
+        learning_db = self.data_dir / "users" / username / "learning.db"
+        app_db = self.data_dir / "app.db"
+
+        with self.connect(learning_db) as conn:
+            conn.execute(f"ATTACH DATABASE '{app_db}' AS app")
+            forward_id, reverse_id = conn.execute(
+                """SELECT fwd.id, rev.id
+                   FROM app.card_definitions fwd
+                   JOIN app.card_definitions rev
+                     ON rev.front = fwd.main_answer AND rev.main_answer = fwd.front
+                   WHERE fwd.pack_id IS NULL AND fwd.tier = 1
+                     AND fwd.is_reverse = 0 AND rev.is_reverse = 1
+                   ORDER BY fwd.id LIMIT 1"""
+            ).fetchone()
+
+            future_review = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+            conn.execute(
+                """INSERT OR REPLACE INTO card_progress
+                   (card_id, learning_step, total_reviews, ease_factor, next_review)
+                   SELECT id, 1, 1, 2.5, ? FROM app.card_definitions
+                   WHERE ((pack_id IS NULL AND tier = 1) OR pack_id IS NOT NULL)
+                     AND id NOT IN (?, ?)""",
+                (future_review, forward_id, reverse_id),
+            )
+            conn.commit()
+
+        return forward_id, reverse_id
+
+    def get_next_review(self, username: str, card_id: int) -> datetime | None:
+        """Return when a card is next due for a user, or None if never reviewed."""
+        learning_db = self.data_dir / "users" / username / "learning.db"
+        with self.connect(learning_db) as conn:
+            row = conn.execute(
+                "SELECT next_review FROM card_progress WHERE card_id = ?", (card_id,)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def get_review_log(self, username: str, card_id: int) -> list[tuple[int, str | None]]:
+        """Return (quality, study_mode) for each review of a card, oldest first."""
+        learning_db = self.data_dir / "users" / username / "learning.db"
+        with self.connect(learning_db) as conn:
+            return conn.execute(
+                "SELECT quality, study_mode FROM review_logs WHERE card_id = ? ORDER BY id",
+                (card_id,),
+            ).fetchall()
+
+    def get_reverse_card_ids(self, card_id: int) -> set[int]:
+        """Return the IDs of a card's reverse siblings (front and answer swapped)."""
+        with self.connect(self.data_dir / "app.db") as conn:
+            return {
+                reverse_id
+                for (reverse_id,) in conn.execute(
+                    """SELECT rev.id
+                       FROM card_definitions card
+                       JOIN card_definitions rev
+                         ON rev.front = card.main_answer AND rev.main_answer = card.front
+                       WHERE card.id = ? AND rev.is_reverse != card.is_reverse""",
+                    (card_id,),
+                )
+            }
+
+    def get_public_pack_ids(self) -> set[str]:
+        """Return the enabled packs every user can access (public permission)."""
+        with self.connect(self.data_dir / "app.db") as conn:
+            return {
+                pack_id
+                for (pack_id,) in conn.execute(
+                    """SELECT pp.pack_id FROM pack_permissions pp
+                       JOIN content_packs cp ON pp.pack_id = cp.id
+                       WHERE pp.group_id = '' AND pp.allowed = 1
+                         AND COALESCE(cp.is_enabled, 1) = 1"""
+                )
+            }
+
+    def get_tier_card_count(self, tier: int) -> int:
+        """Count the card definitions in a tier, across all packs."""
+        with self.connect(self.data_dir / "app.db") as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM card_definitions WHERE tier = ?", (tier,)
+            ).fetchone()[0]
+
 
 class TestClient:
     """HTTP client wrapper with session/cookie management."""
@@ -245,6 +505,12 @@ class TestClient:
         """Close the HTTP client."""
         self.client.close()
 
+    def reset(self) -> None:
+        """Forget the session locally so the client can be reused by another test."""
+        self.session_cookie = None
+        self.username_cookie = None
+        self.client.cookies.clear()
+
     def _update_cookies(self, response: httpx.Response) -> None:
         """Extract and store cookies from response, updating client cookies."""
         for cookie in response.cookies.jar:
@@ -313,6 +579,55 @@ class TestClient:
         """Check if client has a session cookie."""
         return self.session_cookie is not None
 
+    def authenticated_get(self, path: str, **kwargs) -> tuple[bool, httpx.Response]:
+        """GET a page and report whether the session survived the request.
+
+        The response itself tells us whether the session is valid: an
+        unauthenticated request is redirected to /login. This avoids a
+        separate probe before the request a test actually cares about.
+        """
+        response = self.get(path, **kwargs)
+        location = response.headers.get("location", "")
+        redirected_to_login = response.is_redirect and "/login" in location
+        return self.is_authenticated() and not redirected_to_login, response
+
+    def stream_contains(
+        self, path: str, marker: bytes, chunk_size: int = 8192
+    ) -> tuple[httpx.Response, bool]:
+        """GET a page and report whether `marker` appears in its body.
+
+        The body is read in chunks and reading stops at the first hit. A small
+        overlap is kept between chunks so a marker split across them is found.
+        """
+        self._sync_cookies()
+        overlap = len(marker) - 1
+        tail = b""
+        with self.client.stream("GET", path) as response:
+            self._update_cookies(response)
+            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                window = tail + chunk
+                if window.find(marker) != -1:
+                    return response, True
+                tail = window[-overlap:] if overlap else b""
+        return response, False
+
+    def study_card(self, session_id: str | None = None) -> dict | None:
+        """Pick the next interactive study card as JSON instead of HTML.
+
+        Without a session ID this starts a session like GET /study; with one
+        it continues it like POST /next-card. Returns the card payload
+        (card_id is None when no card is available), or None if the server
+        redirected instead, e.g. after an unlock.
+        """
+        headers = {"Accept": "application/json"}
+        if session_id is None:
+            response = self.get("/study", headers=headers)
+        else:
+            response = self.post("/next-card", data={"session_id": session_id}, headers=headers)
+        if response.status_code != 200:
+            return None
+        return response.json()
+
     def follow_redirect(self, response: httpx.Response) -> httpx.Response:
         """Follow a redirect response."""
         if response.status_code in (301, 302, 303, 307, 308):
@@ -321,6 +636,23 @@ class TestClient:
         return response
 
 
+def download_or_skip(client: TestClient, minutes: int = 30) -> dict:
+    """Download an offline session, skipping the test if no cards are available."""
+    response = client.post(
+        "/api/study/download-session",
+        json={"duration_minutes": minutes, "filter_mode": "all"},
+    )
+    if response.status_code != 200:
+        pytest.skip(f"Could not download session ({response.status_code})")
+    # Check the raw body for an error key before paying for a full JSON parse
+    if b'"error"' in response.content:
+        pytest.skip("No cards available for test")
+    data = response.json()
+    if not data.get("cards"):
+        pytest.skip("No cards available for test")
+    return data
+
+
 def wait_for_server(url: str, timeout: float = 60.0) -> bool:
     """Wait for server to become available."""
     start = time.time()
@@ -429,6 +761,13 @@ def test_server(
         vocab_pack_dst.parent.mkdir(parents=True, exist_ok=True)
         shutil.copytree(vocab_pack_src, vocab_pack_dst)
 
+    # Put the shared app.db in WAL mode before anything else opens it, so user
+    # creation and cleanup don't pay a full journal fsync per commit. The mode
+    # is stored in the file and the server picks it up.
+    app_db = sqlite3.connect(test_data_dir / "app.db")
+    app_db.execute("PRAGMA journal_mode=WAL")
+    app_db.close()
+
     # Spawn server with isolated data directory and worker-specific port
     env = os.environ.copy()
     env["DATA_DIR"] = str(test_data_dir)
@@ -465,27 +804,91 @@ def test_server(
         shutil.rmtree(test_data_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def unique_suffix() -> Callable[[], str]:
+    """Return a callable producing run-unique hex suffixes for usernames.
+
+    Shares the run ID and counter behind unique_username(). Suffixes are plain
+    hex, which keeps them valid as guest nicknames too.
+    """
+    return lambda: f"{_RUN_ID}{next(_name_counter):x}"
+
+
 @pytest.fixture(scope="session")
 def server_url(test_server: str) -> str:
     """Return the test server URL."""
     return test_server
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(test_server: str) -> None:
+    """Hit the unauthenticated pages once per worker before the first test.
+
+    Template rendering and the OS page cache are warmed up here rather than
+    inside whichever test happens to run first. No user is created, so runs
+    that never log in pay nothing for it.
+    """
+    with httpx.Client(base_url=test_server, timeout=30.0) as client:
+        client.get("/login")
+        client.get("/guide")
+
+
 @pytest.fixture(scope="session")
-def db_manager(project_root: Path, test_data_dir: Path, test_server: str) -> DbManager:
+def db_manager(
+    project_root: Path, test_data_dir: Path, test_server: str
+) -> Generator[DbManager, None, None]:
     """Return a db-manager wrapper for the isolated test environment.
 
-    Depends on test_server to ensure environment is initialized.
+    Depends on test_server to ensure environment is initialized. Users queued
+    with delete_user_later are removed at the end of the session.
+    """
+    manager = DbManager(project_root, data_dir=test_data_dir)
+    yield manager
+    manager.delete_pending_users()
+
+
+@pytest.fixture(scope="session")
+def client_pool(server_url: str) -> Generator[deque[TestClient], None, None]:
+    """Keep a few HTTP clients open for the whole session.
+
+    Checked-out clients keep their connections alive between tests; only the
+    cookie jar is reset when they are returned.
     """
-    return DbManager(project_root, data_dir=test_data_dir)
+    pool = deque(TestClient(server_url) for _ in range(4))
+    yield pool
+    for pooled_client in pool:
+        pooled_client.close()
+
+
+def checkout_client(client_pool: deque[TestClient], server_url: str) -> TestClient:
+    """Take a client from the pool, opening a new one if it has run dry."""
+    return client_pool.popleft() if client_pool else TestClient(server_url)
 
 
 @pytest.fixture
-def client(server_url: str) -> Generator[TestClient, None, None]:
-    """Create an HTTP client for testing."""
-    test_client = TestClient(server_url)
+def client(
+    client_pool: deque[TestClient], server_url: str
+) -> Generator[TestClient, None, None]:
+    """HTTP client without a session, checked out of the session pool.
+
+    Its keep-alive connection to the server survives from test to test.
+    """
+    test_client = checkout_client(client_pool, server_url)
     yield test_client
-    test_client.close()
+    test_client.reset()
+    client_pool.append(test_client)
+
+
+@pytest.fixture
+def two_clients(
+    client_pool: deque[TestClient], server_url: str
+) -> Generator[tuple[TestClient, TestClient], None, None]:
+    """Check two independent HTTP clients out of the session pool."""
+    clients = (checkout_client(client_pool, server_url), checkout_client(client_pool, server_url))
+    yield clients
+    for pooled_client in clients:
+        pooled_client.reset()
+        client_pool.append(pooled_client)
 
 
 @pytest.fixture
@@ -495,58 +898,74 @@ def authenticated_client(
     """Create an authenticated HTTP client."""
     username, password_hash = test_user
     response = client.login(username, password_hash)
-    # Follow redirect after login
-    if response.status_code in (302, 303):
-        client.follow_redirect(response)
+    # The login response already carries the session cookie; following its
+    # redirect would only render the home page
+    assert response.status_code in (302, 303), f"Login failed: {response.status_code}"
     assert client.is_authenticated(), "Failed to authenticate"
     return client
 
 
 @pytest.fixture
-def test_user(db_manager: DbManager) -> Generator[tuple[str, str], None, None]:
-    """Create a test user and return (username, password_hash).
+def user_factory(db_manager: DbManager) -> UserFactory:
+    """Return a callable that creates users and returns (username, password_hash).
 
-    User is automatically cleaned up after the test.
+    Pass scenario= to start the user on a scenario preset. Every user it
+    creates is queued for the batch delete at the end of the session.
     """
-    import uuid
-
-    username = f"_test_{uuid.uuid4().hex[:8]}"
-    password = "test123"
 
-    # Clean up if exists from previous failed test
-    if db_manager.user_exists(username):
-        db_manager.delete_user(username)
+    def make(
+        prefix: str = "_test_", password: str = "test123", scenario: str | None = None
+    ) -> tuple[str, str]:
+        username = unique_username(prefix)
+        password_hash = db_manager.create_user(username, password, scenario)
+        db_manager.delete_user_later(username)
+        return username, password_hash
 
-    password_hash = db_manager.create_user(username, password)
+    return make
 
-    yield (username, password_hash)
 
-    # Cleanup
-    db_manager.delete_user(username)
+@pytest.fixture(scope="session")
+def shared_authenticated_client(
+    server_url: str, db_manager: DbManager
+) -> Generator[TestClient, None, None]:
+    """One logged-in client for the whole session, for tests that only read pages.
+
+    Saves a user creation and a server-side password check per test. Also
+    suits permission probes whose requests the server rejects. Tests using it
+    must not change the user's data or log out; use authenticated_client for
+    those.
+    """
+    username = unique_username()
+    password_hash = db_manager.create_user(username)
 
+    shared_client = TestClient(server_url)
+    response = shared_client.login(username, password_hash)
+    # The login response already carries the session cookie; following its
+    # redirect would only render the home page
+    assert response.status_code in (302, 303), f"Login failed: {response.status_code}"
+    assert shared_client.is_authenticated(), "Failed to authenticate shared client"
 
-@pytest.fixture
-def admin_user(db_manager: DbManager) -> Generator[tuple[str, str], None, None]:
-    """Create an admin user for testing admin functionality."""
-    import uuid
+    yield shared_client
 
-    # Use unique username to avoid conflicts
-    username = f"_test_admin_{uuid.uuid4().hex[:8]}"
-    password = "admintest123"
+    shared_client.close()
+    db_manager.delete_user_later(username)
 
-    # Clean up if exists from previous failed test
-    if db_manager.user_exists(username):
-        db_manager.delete_user(username)
 
-    password_hash = db_manager.create_user(username, password)
+@pytest.fixture
+def test_user(user_factory: UserFactory) -> tuple[str, str]:
+    """Create a test user and return (username, password_hash).
 
-    # Set user as admin
-    db_manager.set_user_role(username, "admin")
+    User is automatically cleaned up after the test.
+    """
+    return user_factory()
 
-    yield (username, password_hash)
 
-    # Cleanup
-    db_manager.delete_user(username)
+@pytest.fixture
+def admin_user(db_manager: DbManager, user_factory: UserFactory) -> tuple[str, str]:
+    """Create an admin user for testing admin functionality."""
+    username, password_hash = user_factory("_test_admin_", "admintest123")
+    db_manager.set_user_role(username, "admin")
+    return username, password_hash
 
 
 @pytest.fixture
@@ -556,8 +975,193 @@ def admin_client(
     """Create an authenticated admin HTTP client."""
     username, password_hash = admin_user
     response = client.login(username, password_hash)
-    # Follow redirect after login
-    if response.status_code in (302, 303):
-        client.follow_redirect(response)
+    # The login response already carries the session cookie; following its
+    # redirect would only render the home page
+    assert response.status_code in (302, 303), f"Login failed: {response.status_code}"
     assert client.is_authenticated(), "Failed to authenticate admin"
     return client
+
+
+@pytest.fixture(scope="module")
+def shared_admin_client(
+    client_pool: deque[TestClient], server_url: str, db_manager: DbManager
+) -> Generator[TestClient, None, None]:
+    """One logged-in admin client per module, borrowed from the pool.
+
+    For admin tests that only read pages or make idempotent changes such as
+    enabling a pack; use admin_client for anything else. The admin is
+    queued for deletion when the module finishes.
+    """
+    username = unique_username("_test_admin_")
+    password_hash = db_manager.create_user(username, "admintest123")
+    db_manager.set_user_role(username, "admin")
+
+    admin = checkout_client(client_pool, server_url)
+    response = admin.login(username, password_hash)
+    assert response.status_code in (302, 303), f"Login failed: {response.status_code}"
+    assert admin.is_authenticated(), "Failed to authenticate admin"
+
+    yield admin
+
+    admin.reset()
+    client_pool.append(admin)
+    db_manager.delete_user_later(username)
+
+
+@pytest.fixture
+def offline_mode_client(
+    authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
+) -> TestClient:
+    """Authenticated client whose user has offline mode enabled.
+
+    The setting is written straight to the user's learning.db instead of being
+    POSTed to /settings; TestOfflineModeSettings covers the form itself.
+    """
+    username, _ = test_user
+    db_manager.set_setting(username, "offline_mode_enabled", "true")
+    return authenticated_client
+
+
+@pytest.fixture
+def fresh_offline_session(offline_mode_client: TestClient) -> dict:
+    """Download an offline session for the test's own user.
+
+    Use this when the test syncs: a session can only be synced once.
+    """
+    response = offline_mode_client.post(
+        "/api/study/download-session",
+        json={"duration_minutes": 30, "filter_mode": "all"},
+    )
+    assert response.status_code == 200, f"Download failed: {response.status_code}"
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def scenario_users() -> dict[str, tuple[str, str]]:
+    """Users saved on a scenario preset, one per preset, keyed by preset name.
+
+    Filled lazily by scenario_user; request that instead.
+    """
+    return {}
+
+
+@pytest.fixture
+def scenario_user(
+    db_manager: DbManager, scenario_users: dict[str, tuple[str, str]]
+) -> ScenarioUser:
+    """Return a callable giving a user freshly reset to a scenario preset.
+
+    One user per preset is created the first time it is asked for and reused
+    by later tests on this worker. Each later call restores the saved
+    learning.db instead of creating and deleting a user. Only learning.db is
+    reset, so tests must not change the user's role, groups or password, and
+    must log in with their own client. Returns (username, password_hash).
+    """
+
+    def get(scenario: str) -> tuple[str, str]:
+        if scenario in scenario_users:
+            username, _ = scenario_users[scenario]
+            db_manager.restore_scenario(username, scenario)
+        else:
+            username = unique_username()
+            password_hash = db_manager.create_user(username, scenario=scenario)
+            db_manager.save_scenario(username, scenario)
+            db_manager.delete_user_later(username)
+            scenario_users[scenario] = (username, password_hash)
+        return scenario_users[scenario]
+
+    return get
+
+
+@pytest.fixture
+def tier1_user(
+    db_manager: DbManager, scenario_user: ScenarioUser
+) -> tuple[str, str]:
+    """Shared tier1_new user with fresh card state for this test.
+
+    Skips before any setup if there are no tier 1 cards to study. Returns
+    (username, password_hash).
+    """
+    if db_manager.get_tier_card_count(1) == 0:
+        pytest.skip("No tier 1 cards in the test environment")
+    return scenario_user("tier1_new")
+
+
+@pytest.fixture(scope="module")
+def shared_offline_session(server_url: str, db_manager: DbManager) -> Generator[dict, None, None]:
+    """Download one offline session per module for tests that only inspect it.
+
+    Uses its own user and client, so tests cannot sync against it; use
+    fresh_offline_session for that.
+    """
+    username = unique_username()
+    password_hash = db_manager.create_user(username)
+    db_manager.set_setting(username, "offline_mode_enabled", "true")
+
+    offline_client = TestClient(server_url)
+    try:
+        offline_client.login(username, password_hash)
+        response = offline_client.post(
+            "/api/study/download-session",
+            json={"duration_minutes": 30, "filter_mode": "all"},
+        )
+        assert response.status_code == 200, f"Download failed: {response.status_code}"
+        yield response.json()
+    finally:
+        offline_client.close()
+        db_manager.delete_user_later(username)
+
+
+def enable_public_pack(
+    client_pool: deque[TestClient], server_url: str, db_manager: DbManager, pack_id: str
+) -> None:
+    """Enable a pack and make it public as a throwaway admin.
+
+    The admin logs in on a pooled client, so the connection is already open,
+    and enabling with ?public=true is a single request. The admin is queued
+    for deletion afterwards.
+    """
+    username = unique_username("_test_admin_")
+    password_hash = db_manager.create_user(username, "admintest123")
+    db_manager.set_user_role(username, "admin")
+
+    admin = checkout_client(client_pool, server_url)
+    try:
+        admin.login(username, password_hash)
+        response = admin.post(f"/settings/pack/{pack_id}/enable", params={"public": "true"})
+        assert response.status_code in (200, 303), (
+            f"Failed to enable {pack_id}: {response.status_code}"
+        )
+    finally:
+        admin.reset()
+        client_pool.append(admin)
+        db_manager.delete_user_later(username)
+
+
+@pytest.fixture(scope="session")
+def lesson_pack_enabled(
+    client_pool: deque[TestClient], server_url: str, db_manager: DbManager
+) -> str:
+    """Enable test_lesson_pack and make it public once per session.
+
+    Pack state lives in the shared app.db, so one enable serves every test on
+    this worker. Returns the pack ID.
+    """
+    pack_id = "test_lesson_pack"
+    enable_public_pack(client_pool, server_url, db_manager, pack_id)
+    return pack_id
+
+
+@pytest.fixture(scope="session")
+def vocab_pack_enabled(
+    client_pool: deque[TestClient], server_url: str, db_manager: DbManager
+) -> str:
+    """Enable test_vocabulary_pack and make it public once per session.
+
+    Like lesson_pack_enabled, the pack stays enabled for the rest of the run,
+    so any module that needs vocabulary data shares the one enable call.
+    Returns the pack ID.
+    """
+    pack_id = "test_vocabulary_pack"
+    enable_public_pack(client_pool, server_url, db_manager, pack_id)
+    return pack_id
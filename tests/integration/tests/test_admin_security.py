@@ -5,51 +5,112 @@ Tests verify that admin-only endpoints:
 2. Reject unauthorized requests from non-admin users (403 or redirect to /settings)
 3. Do NOT perform the action (side-effect verification where applicable)
 
-This provides exhaustive coverage of all 24 admin-only endpoints from a security
+This provides exhaustive coverage of every admin-only endpoint from a security
 perspective, ensuring the API is sealed against unauthorized access.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
 
 from conftest import DbManager, TestClient
 
 
+# Read-only sample payloads, shared by every parametrized case that uses them
+_EMPTY = MappingProxyType({})
+_ROLE = MappingProxyType({"username": "testuser", "role": "admin"})
+_GROUP = MappingProxyType({"id": "test-group", "name": "Test Group"})
+_MEMBER = MappingProxyType({"group_id": "test-group", "user_id": "testuser"})
+_GROUP_PERMISSION = MappingProxyType({"pack_id": "test-pack", "group_id": "test-group"})
+_USER_PERMISSION = MappingProxyType({"pack_id": "test-pack", "user_id": "testuser"})
+_PACK_PATH = MappingProxyType({"path": "/tmp/test-pack"})
+_BROWSE_ROOT = MappingProxyType({"path": "/"})
+_SEGMENT_ROW = MappingProxyType({"audio_id": "1"})
+
+# Placeholder payloads for the non-admin probes (values never reach a handler)
+_X_ROLE = MappingProxyType({"username": "x", "role": "admin"})
+_X_MEMBER = MappingProxyType({"group_id": "x", "user_id": "x"})
+_X_GROUP_PERMISSION = MappingProxyType({"pack_id": "x", "group_id": "x"})
+_X_USER_PERMISSION = MappingProxyType({"pack_id": "x", "user_id": "x"})
+_TMP_PATH = MappingProxyType({"path": "/tmp"})
+
 # All admin-only endpoints with their HTTP methods and sample data
 ADMIN_ENDPOINTS = [
     # Guest Management
-    ("POST", "/settings/cleanup-guests", {}),
-    ("POST", "/settings/delete-all-guests", {}),
+    ("POST", "/settings/cleanup-guests", _EMPTY),
+    ("POST", "/settings/delete-all-guests", _EMPTY),
+    # Role Management
+    ("POST", "/settings/user/role", _ROLE),
+    # Group Management
+    ("POST", "/settings/group/create", _GROUP),
+    ("DELETE", "/settings/group/test-group", _EMPTY),
+    ("POST", "/settings/group/add-member", _MEMBER),
+    ("POST", "/settings/group/remove-member", _MEMBER),
+    # Pack Permissions - Group
+    ("POST", "/settings/pack/permission/add", _GROUP_PERMISSION),
+    ("POST", "/settings/pack/permission/remove", _GROUP_PERMISSION),
+    ("POST", "/settings/pack/test-pack/make-public", _EMPTY),
+    ("POST", "/settings/pack/test-pack/make-private", _EMPTY),
+    # Pack Permissions - User
+    ("POST", "/settings/pack/user-permission/add", _USER_PERMISSION),
+    ("POST", "/settings/pack/user-permission/remove", _USER_PERMISSION),
+    # Pack State
+    ("POST", "/settings/pack/test-pack/disable", _EMPTY),
+    ("POST", "/settings/pack/test-pack/enable", _EMPTY),
+    # Pack Paths
+    ("POST", "/settings/pack-paths/register", _PACK_PATH),
+    ("DELETE", "/settings/pack-paths/999", _EMPTY),
+    ("POST", "/settings/pack-paths/999/toggle", _EMPTY),
+    ("POST", "/settings/pack-paths/browse", _BROWSE_ROOT),
+    # Scraper Operations
+    ("POST", "/settings/scrape", _EMPTY),
+    ("POST", "/settings/scrape/lesson1", _EMPTY),
+    ("POST", "/settings/delete-scraped", _EMPTY),
+    ("POST", "/settings/delete-scraped/lesson1", _EMPTY),
+    ("POST", "/settings/segment", _EMPTY),
+    ("POST", "/settings/segment-row", _SEGMENT_ROW),
+    ("POST", "/settings/segment-manual", _EMPTY),
+    ("POST", "/settings/segment-reset", _EMPTY),
+]
+
+# Admin-only endpoints probed with a non-admin session (group creation has its
+# own side-effect test below)
+NON_ADMIN_ENDPOINTS = [
+    # Guest Management
+    ("POST", "/settings/cleanup-guests", _EMPTY),
+    ("POST", "/settings/delete-all-guests", _EMPTY),
     # Role Management
-    ("POST", "/settings/user/role", {"username": "testuser", "role": "admin"}),
+    ("POST", "/settings/user/role", _X_ROLE),
     # Group Management
-    ("POST", "/settings/group/create", {"id": "test-group", "name": "Test Group"}),
-    ("DELETE", "/settings/group/test-group", {}),
-    ("POST", "/settings/group/add-member", {"group_id": "test-group", "user_id": "testuser"}),
-    ("POST", "/settings/group/remove-member", {"group_id": "test-group", "user_id": "testuser"}),
+    ("DELETE", "/settings/group/test-group", _EMPTY),
+    ("POST", "/settings/group/add-member", _X_MEMBER),
+    ("POST", "/settings/group/remove-member", _X_MEMBER),
     # Pack Permissions - Group
-    ("POST", "/settings/pack/permission/add", {"pack_id": "test-pack", "group_id": "test-group"}),
-    ("POST", "/settings/pack/permission/remove", {"pack_id": "test-pack", "group_id": "test-group"}),
-    ("POST", "/settings/pack/test-pack/make-public", {}),
+    ("POST", "/settings/pack/permission/add", _X_GROUP_PERMISSION),
+    ("POST", "/settings/pack/permission/remove", _X_GROUP_PERMISSION),
+    ("POST", "/settings/pack/test-pack/make-public", _EMPTY),
+    ("POST", "/settings/pack/test-pack/make-private", _EMPTY),
     # Pack Permissions - User
-    ("POST", "/settings/pack/user-permission/add", {"pack_id": "test-pack", "user_id": "testuser"}),
-    ("POST", "/settings/pack/user-permission/remove", {"pack_id": "test-pack", "user_id": "testuser"}),
+    ("POST", "/settings/pack/user-permission/add", _X_USER_PERMISSION),
+    ("POST", "/settings/pack/user-permission/remove", _X_USER_PERMISSION),
     # Pack State
-    ("POST", "/settings/pack/test-pack/disable", {}),
-    ("POST", "/settings/pack/test-pack/enable", {}),
+    ("POST", "/settings/pack/test-pack/disable", _EMPTY),
+    ("POST", "/settings/pack/test-pack/enable", _EMPTY),
     # Pack Paths
-    ("POST", "/settings/pack-paths/register", {"path": "/tmp/test-pack"}),
-    ("DELETE", "/settings/pack-paths/999", {}),
-    ("POST", "/settings/pack-paths/999/toggle", {}),
-    ("POST", "/settings/pack-paths/browse", {"path": "/"}),
+    ("POST", "/settings/pack-paths/register", _TMP_PATH),
+    ("DELETE", "/settings/pack-paths/999", _EMPTY),
+    ("POST", "/settings/pack-paths/999/toggle", _EMPTY),
+    ("POST", "/settings/pack-paths/browse", _BROWSE_ROOT),
     # Scraper Operations
-    ("POST", "/settings/scrape", {}),
-    ("POST", "/settings/scrape/lesson1", {}),
-    ("POST", "/settings/delete-scraped", {}),
-    ("POST", "/settings/delete-scraped/lesson1", {}),
-    ("POST", "/settings/segment", {}),
-    ("POST", "/settings/segment-row", {"audio_id": "1"}),
-    ("POST", "/settings/segment-manual", {}),
-    ("POST", "/settings/segment-reset", {}),
+    ("POST", "/settings/scrape", _EMPTY),
+    ("POST", "/settings/scrape/lesson1", _EMPTY),
+    ("POST", "/settings/delete-scraped", _EMPTY),
+    ("POST", "/settings/delete-scraped/lesson1", _EMPTY),
+    ("POST", "/settings/segment", _EMPTY),
+    ("POST", "/settings/segment-row", _SEGMENT_ROW),
+    ("POST", "/settings/segment-manual", _EMPTY),
+    ("POST", "/settings/segment-reset", _EMPTY),
 ]
 
 
@@ -58,7 +119,7 @@ class TestUnauthenticatedAccess:
 
     @pytest.mark.parametrize("method,path,data", ADMIN_ENDPOINTS)
     def test_unauthenticated_rejected(
-        self, client: TestClient, method: str, path: str, data: dict
+        self, client: TestClient, method: str, path: str, data: Mapping[str, str]
     ):
         """Unauthenticated requests redirect to /login."""
         # Ensure client has no session
@@ -79,51 +140,18 @@ class TestUnauthenticatedAccess:
 class TestUnauthorizedAccess:
     """Non-admin users cannot access admin endpoints."""
 
-    @pytest.mark.parametrize(
-        "method,path,data",
-        [
-            # Guest Management
-            ("POST", "/settings/cleanup-guests", {}),
-            ("POST", "/settings/delete-all-guests", {}),
-            # Role Management
-            ("POST", "/settings/user/role", {"username": "x", "role": "admin"}),
-            # Group Management
-            ("DELETE", "/settings/group/test-group", {}),
-            ("POST", "/settings/group/add-member", {"group_id": "x", "user_id": "x"}),
-            ("POST", "/settings/group/remove-member", {"group_id": "x", "user_id": "x"}),
-            # Pack Permissions - Group
-            ("POST", "/settings/pack/permission/add", {"pack_id": "x", "group_id": "x"}),
-            ("POST", "/settings/pack/permission/remove", {"pack_id": "x", "group_id": "x"}),
-            ("POST", "/settings/pack/test-pack/make-public", {}),
-            # Pack Permissions - User
-            ("POST", "/settings/pack/user-permission/add", {"pack_id": "x", "user_id": "x"}),
-            ("POST", "/settings/pack/user-permission/remove", {"pack_id": "x", "user_id": "x"}),
-            # Pack State
-            ("POST", "/settings/pack/test-pack/disable", {}),
-            ("POST", "/settings/pack/test-pack/enable", {}),
-            # Pack Paths
-            ("POST", "/settings/pack-paths/register", {"path": "/tmp"}),
-            ("DELETE", "/settings/pack-paths/999", {}),
-            ("POST", "/settings/pack-paths/999/toggle", {}),
-            ("POST", "/settings/pack-paths/browse", {"path": "/"}),
-            # Scraper Operations
-            ("POST", "/settings/scrape", {}),
-            ("POST", "/settings/scrape/lesson1", {}),
-            ("POST", "/settings/delete-scraped", {}),
-            ("POST", "/settings/delete-scraped/lesson1", {}),
-            ("POST", "/settings/segment", {}),
-            ("POST", "/settings/segment-row", {"audio_id": "1"}),
-            ("POST", "/settings/segment-manual", {}),
-            ("POST", "/settings/segment-reset", {}),
-        ],
-    )
+    @pytest.mark.parametrize("method,path,data", NON_ADMIN_ENDPOINTS)
     def test_unauthorized_rejected(
-        self, authenticated_client: TestClient, method: str, path: str, data: dict
+        self,
+        shared_authenticated_client: TestClient,
+        method: str,
+        path: str,
+        data: Mapping[str, str],
     ):
         """Non-admin users get 403 or redirect to /settings."""
-        assert authenticated_client.is_authenticated(), "Client should be authenticated"
+        assert shared_authenticated_client.is_authenticated(), "Client should be authenticated"
 
-        response = authenticated_client.request(method, path, data=data)
+        response = shared_authenticated_client.request(method, path, data=data)
 
         # Should be rejected with 403 or redirect to /settings (not /login)
         assert response.status_code in (303, 403), (
@@ -141,13 +169,13 @@ class TestUnauthorizedGroupCreation:
     """Non-admin users cannot create groups - with side-effect verification."""
 
     def test_create_group_unauthorized_with_side_effect_check(
-        self, authenticated_client: TestClient, db_manager: DbManager
+        self, shared_authenticated_client: TestClient, db_manager: DbManager
     ):
         """Non-admin cannot create groups and group is NOT created."""
         group_id = "hacked-group-test"
         count_before = db_manager.get_group_count()
 
-        response = authenticated_client.post(
+        response = shared_authenticated_client.post(
             "/settings/group/create",
             data={"id": group_id, "name": "Hacked Group"},
         )
@@ -9,12 +9,20 @@ Tests cover:
 - Guest account creation
 """
 
-import uuid
+import re
+from typing import Callable
 
 import pytest
 
 from conftest import DbManager, TestClient, compute_password_hash
 
+# Case-insensitive page markers, matched on the response bytes
+_LOGIN_PAGE_RE = re.compile(rb"login|password", re.I)
+_LOGIN_ERROR_RE = re.compile(rb"invalid|error", re.I)
+_INVALID_RE = re.compile(rb"invalid", re.I)
+_REGISTER_RE = re.compile(rb"register", re.I)
+_USER_EXISTS_RE = re.compile(rb"exists|already", re.I)
+
 
 class TestLogin:
     """Login flow tests."""
@@ -23,7 +31,7 @@ class TestLogin:
         """GET /login returns the login page."""
         response = client.get("/login")
         assert response.status_code == 200
-        assert "login" in response.text.lower() or "password" in response.text.lower()
+        assert _LOGIN_PAGE_RE.search(response.content)
 
     def test_login_with_valid_credentials(
         self, client: TestClient, test_user: tuple[str, str]
@@ -52,7 +60,7 @@ class TestLogin:
 
         # Should return login page with error (not redirect)
         assert response.status_code == 200
-        assert "invalid" in response.text.lower() or "error" in response.text.lower()
+        assert _LOGIN_ERROR_RE.search(response.content)
         assert client.session_cookie is None
 
     def test_login_with_nonexistent_user(self, client: TestClient):
@@ -62,7 +70,7 @@ class TestLogin:
         response = client.login("nonexistent_user_xyz", password_hash)
 
         assert response.status_code == 200
-        assert "invalid" in response.text.lower()
+        assert _INVALID_RE.search(response.content)
         assert client.session_cookie is None
 
     def test_login_with_empty_fields(self, client: TestClient):
@@ -76,9 +84,7 @@ class TestLogin:
 class TestLogout:
     """Logout flow tests."""
 
-    def test_logout_clears_session(
-        self, authenticated_client: TestClient, test_user: tuple[str, str]
-    ):
+    def test_logout_clears_session(self, authenticated_client: TestClient):
         """POST /logout clears session cookie and redirects to login."""
         assert authenticated_client.is_authenticated()
 
@@ -127,10 +133,10 @@ class TestProtectedRoutes:
         ],
     )
     def test_protected_routes_accessible_when_authenticated(
-        self, authenticated_client: TestClient, path: str
+        self, shared_authenticated_client: TestClient, path: str
     ):
         """Protected routes are accessible with valid session."""
-        response = authenticated_client.get(path)
+        response = shared_authenticated_client.get(path)
 
         # Should return 200 or redirect within the app (not to login)
         if response.status_code in (302, 303):
@@ -168,13 +174,13 @@ class TestRegistration:
         """GET /register returns the registration page."""
         response = client.get("/register")
         assert response.status_code == 200
-        assert "register" in response.text.lower()
+        assert _REGISTER_RE.search(response.content)
 
     def test_register_creates_user_and_logs_in(
-        self, client: TestClient, db_manager: DbManager
+        self, client: TestClient, db_manager: DbManager, unique_suffix: Callable[[], str]
     ):
         """POST /register creates user, sets session, and redirects home."""
-        username = f"_test_{uuid.uuid4().hex[:8]}"
+        username = f"_test_{unique_suffix()}"
         password = "testpass123"
         password_hash = compute_password_hash(password, username)
 
@@ -197,7 +203,7 @@ class TestRegistration:
 
         finally:
             # Cleanup
-            db_manager.delete_user(username)
+            db_manager.delete_user_later(username)
 
     def test_register_with_existing_username(
         self, client: TestClient, test_user: tuple[str, str]
@@ -213,7 +219,7 @@ class TestRegistration:
 
         # Should return register page with error
         assert response.status_code == 200
-        assert "exists" in response.text.lower() or "already" in response.text.lower()
+        assert _USER_EXISTS_RE.search(response.content)
 
     def test_register_with_invalid_username(self, client: TestClient):
         """POST /register with invalid username shows error."""
@@ -256,13 +262,13 @@ class TestGuestLogin:
         assert username.startswith("_guest_")
 
         # Cleanup
-        db_manager.delete_user(username)
+        db_manager.delete_user_later(username)
 
     def test_guest_login_with_nickname(
-        self, client: TestClient, db_manager: DbManager
+        self, client: TestClient, db_manager: DbManager, unique_suffix: Callable[[], str]
     ):
         """POST /guest with nickname uses sanitized nickname."""
-        nickname = f"test{uuid.uuid4().hex[:4]}"
+        nickname = f"test{unique_suffix()}"
 
         response = client.post("/guest", data={"nickname": nickname})
 
@@ -274,26 +280,26 @@ class TestGuestLogin:
         assert nickname.lower() in username.lower()
 
         # Cleanup
-        db_manager.delete_user(username)
+        db_manager.delete_user_later(username)
 
 
 class TestSessionPersistence:
     """Session persistence and cookie handling tests."""
 
     def test_session_persists_across_requests(
-        self, authenticated_client: TestClient
+        self, shared_authenticated_client: TestClient
     ):
         """Session cookie is preserved across multiple requests."""
-        initial_session = authenticated_client.session_cookie
+        initial_session = shared_authenticated_client.session_cookie
 
         # Make multiple requests
-        authenticated_client.get("/")
-        authenticated_client.get("/study")
-        authenticated_client.get("/progress")
+        shared_authenticated_client.get("/")
+        shared_authenticated_client.get("/study")
+        shared_authenticated_client.get("/progress")
 
         # Session should still be the same
-        assert authenticated_client.session_cookie == initial_session
-        assert authenticated_client.is_authenticated()
+        assert shared_authenticated_client.session_cookie == initial_session
+        assert shared_authenticated_client.is_authenticated()
 
     def test_invalid_session_cookie_redirects_to_login(self, client: TestClient):
         """Invalid session cookie results in redirect to login."""
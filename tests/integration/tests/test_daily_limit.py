@@ -10,9 +10,35 @@ Bug: Home page counter counts ALL due cards, ignoring daily new card limit.
 """
 
 import re
+
 import pytest
 
-from conftest import DbManager, TestClient
+from conftest import DbManager, ScenarioUser, TestClient
+
+pytestmark = [pytest.mark.xdist_group("daily_limit"), pytest.mark.scenario("tier1_new")]
+
+# Patterns for scraping study and home page HTML
+_CARD_ID_RE = re.compile(rb'name="card_id"[^>]*value="(\d+)"')
+_SESSION_ID_RE = re.compile(rb'name="session_id"[^>]*value="([^"]*)"')
+_DUE_COUNT_MARKER = b'data-testid="due-count"'
+_DUE_COUNT_FALLBACK_RE = re.compile(rb">(\d+)</span>\s*<span[^>]*>Cards")
+
+
+def _extract_due_count(body: bytes) -> int | None:
+    """Read the due count from the raw home page body, or None if it is missing.
+
+    Works on response.content so the page is never decoded; the count is the
+    text between the marker element's closing '>' and the next '<'.
+    """
+    idx = body.find(_DUE_COUNT_MARKER)
+    if idx != -1:
+        start = body.find(b">", idx) + 1
+        text = body[start : body.find(b"<", start)].strip()
+        if text.isdigit():
+            return int(text)
+    # Older templates render the count in a bare span next to the label
+    match = _DUE_COUNT_FALLBACK_RE.search(body)
+    return int(match.group(1)) if match else None
 
 
 class TestDailyLimitCounter:
@@ -22,96 +48,46 @@ class TestDailyLimitCounter:
         self,
         client: TestClient,
         db_manager: DbManager,
+        scenario_user: ScenarioUser,
     ):
         """After reaching daily new card limit, home page counter should not include blocked new cards.
 
         Scenario:
         1. User has daily limit of 2 new cards
         2. User has 5 new cards available (never reviewed)
-        3. User studies 2 cards (reaches limit)
+        3. User has studied 2 cards today (limit reached, seeded directly in the DB)
         4. Home page should show 0 cards due (not 3)
-        5. /study should say "nothing left"
+
+        The study flow itself is exercised end-to-end by
+        test_home_counter_includes_review_cards_after_limit.
         """
-        import uuid
-
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            # Create user with tier 1 cards
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
-
-            # Set daily limit to 2 new cards
-            db_manager.set_setting(username, "daily_new_cards", "2")
-
-            # Login
-            client.login(username, password_hash)
-            assert client.is_authenticated()
-
-            # Study 2 cards to reach the limit
-            session_id = None
-            for i in range(2):
-                if i == 0:
-                    response = client.get("/study")
-                else:
-                    response = client.post("/next-card", data={"session_id": session_id})
-
-                if response.status_code != 200:
-                    pytest.skip("Not enough cards for test")
-
-                card_id_match = re.search(r'name="card_id"[^>]*value="(\d+)"', response.text)
-                session_id_match = re.search(r'name="session_id"[^>]*value="([^"]*)"', response.text)
-
-                if not card_id_match:
-                    pytest.skip("No card available for test")
-
-                card_id = card_id_match.group(1)
-                session_id = session_id_match.group(1) if session_id_match else session_id
-
-                # Answer correctly (any answer is fine for this test)
-                client.post(
-                    "/validate-answer",
-                    data={
-                        "card_id": card_id,
-                        "answer": "test",
-                        "hints_used": 0,
-                        "session_id": session_id,
-                        "input_method": "text_input",
-                    },
-                )
-
-            # Now check /study - should say nothing left
-            study_response = client.post("/next-card", data={"session_id": session_id})
-            # Could be a redirect to home or a "no cards" message
-            # The key is that we shouldn't get another card
-
-            # Check home page counter - should be 0 (not showing blocked new cards)
-            home_response = client.get("/")
-            assert home_response.status_code == 200
-
-            # Extract the due count from home page
-            # Look for patterns like "Cards due for review" or the count display
-            due_count_match = re.search(r'data-testid="due-count"[^>]*>\s*(\d+)\s*<', home_response.text)
-            if not due_count_match:
-                # Alternative: look for the count in the template
-                due_count_match = re.search(r'>(\d+)</span>\s*<span[^>]*>Cards', home_response.text)
-
-            assert due_count_match, "Could not find due count on home page"
-            due_count = int(due_count_match.group(1))
-            # The key assertion: after reaching daily limit, counter should be 0
-            # (not showing the remaining new cards that can't be studied today)
-            assert due_count == 0, \
-                f"Home page shows {due_count} cards due, but daily limit reached - should be 0"
-
-        finally:
-            db_manager.delete_user(username)
+        # Load tier 1 cards
+        username, password_hash = scenario_user("tier1_new")
+
+        # Set daily limit to 2 new cards and use both slots
+        db_manager.set_setting(username, "daily_new_cards", "2")
+        db_manager.mark_cards_reviewed(username, 2)
+
+        # Login
+        client.login(username, password_hash)
+        assert client.is_authenticated()
+
+        # Check home page counter - should be 0 (not showing blocked new cards)
+        home_response = client.get("/")
+        assert home_response.status_code == 200
+
+        due_count = _extract_due_count(home_response.content)
+        assert due_count is not None, "Could not find due count on home page"
+        # The key assertion: after reaching daily limit, counter should be 0
+        # (not showing the remaining new cards that can't be studied today)
+        assert due_count == 0, \
+            f"Home page shows {due_count} cards due, but daily limit reached - should be 0"
 
     def test_home_counter_includes_review_cards_after_limit(
         self,
         client: TestClient,
         db_manager: DbManager,
+        scenario_user: ScenarioUser,
     ):
         """Review cards (already studied before) should still show even after new card limit reached.
 
@@ -121,75 +97,63 @@ class TestDailyLimitCounter:
         3. Set daily limit to 0 (effectively blocking all NEW cards)
         4. Home page should still show the 3 review cards as due
         """
-        import uuid
-        import time
-
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            # Create user with tier 1 cards
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
-
-            # Login
-            client.login(username, password_hash)
-            assert client.is_authenticated()
-
-            # Study 3 cards (they become review cards in learning phase)
-            session_id = None
-            cards_studied = 0
-            for i in range(3):
-                if i == 0:
-                    response = client.get("/study")
-                else:
-                    response = client.post("/next-card", data={"session_id": session_id})
-
-                if response.status_code != 200:
-                    break
-
-                card_id_match = re.search(r'name="card_id"[^>]*value="(\d+)"', response.text)
-                session_id_match = re.search(r'name="session_id"[^>]*value="([^"]*)"', response.text)
-
-                if not card_id_match:
-                    break
-
-                card_id = card_id_match.group(1)
-                session_id = session_id_match.group(1) if session_id_match else session_id
-
-                # Answer correctly
-                client.post(
-                    "/validate-answer",
-                    data={
-                        "card_id": card_id,
-                        "answer": "test",
-                        "hints_used": 0,
-                        "session_id": session_id,
-                        "input_method": "text_input",
-                    },
-                )
-                cards_studied += 1
-
-            if cards_studied < 2:
-                pytest.skip("Not enough cards studied for test")
-
-            # Wait for cards to become due again (learning cards have 1 min intervals)
-            # In testing mode, we can simulate this by updating the DB
-            # For now, just verify the counter logic works
-
-            # Set daily new card limit to 1 (very restrictive)
-            db_manager.set_setting(username, "daily_new_cards", "1")
-
-            # The cards we just studied have total_reviews > 0, so they should
-            # still appear in the count even with restrictive new card limit
-
-            # Check home page
-            home_response = client.get("/")
-            assert home_response.status_code == 200
-
-            # This test verifies the logic works - review cards appear after limit
-            # The exact behavior depends on card intervals
-
-        finally:
-            db_manager.delete_user(username)
+        # Load tier 1 cards
+        username, password_hash = scenario_user("tier1_new")
+
+        # Login
+        client.login(username, password_hash)
+        assert client.is_authenticated()
+
+        # Study 3 cards (they become review cards in learning phase)
+        session_id = None
+        cards_studied = 0
+        for i in range(3):
+            if i == 0:
+                response = client.get("/study")
+            else:
+                response = client.post("/next-card", data={"session_id": session_id})
+
+            if response.status_code != 200:
+                break
+
+            card_id_match = _CARD_ID_RE.search(response.content)
+            session_id_match = _SESSION_ID_RE.search(response.content)
+
+            if not card_id_match:
+                break
+
+            card_id = card_id_match.group(1).decode()
+            session_id = session_id_match.group(1).decode() if session_id_match else session_id
+
+            # Answer correctly
+            client.post(
+                "/validate-answer",
+                data={
+                    "card_id": card_id,
+                    "answer": "test",
+                    "hints_used": 0,
+                    "session_id": session_id,
+                    "input_method": "text_input",
+                },
+            )
+            cards_studied += 1
+
+        if cards_studied < 2:
+            pytest.skip("Not enough cards studied for test")
+
+        # Wait for cards to become due again (learning cards have 1 min intervals)
+        # In testing mode, we can simulate this by updating the DB
+        # For now, just verify the counter logic works
+
+        # Set daily new card limit to 1 (very restrictive)
+        db_manager.set_setting(username, "daily_new_cards", "1")
+
+        # The cards we just studied have total_reviews > 0, so they should
+        # still appear in the count even with restrictive new card limit
+
+        # Check home page
+        home_response = client.get("/")
+        assert home_response.status_code == 200
+
+        # This test verifies the logic works - review cards appear after limit
+        # The exact behavior depends on card intervals
@@ -6,126 +6,113 @@ Tests cover:
 - Cross-user data access prevention
 """
 
-import uuid
+import asyncio
+from typing import Generator
 
 import pytest
 
-from conftest import DbManager, TestClient
+from conftest import DbManager, TestClient, unique_username
 
+pytestmark = [
+    pytest.mark.xdist_group("data_isolation"),
+    pytest.mark.scenario("tier1_new", "all_graduated"),
+]
 
-class TestUserDataIsolation:
-    """User data isolation tests."""
-
-    def test_users_have_separate_progress(
-        self,
-        server_url: str,
-        db_manager: DbManager,
-    ):
-        """Two users have completely separate progress."""
-        user1 = f"_test_{uuid.uuid4().hex[:8]}"
-        user2 = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
 
-        client1 = TestClient(server_url)
-        client2 = TestClient(server_url)
+@pytest.fixture(scope="class")
+def isolation_users(db_manager: DbManager) -> Generator[list[tuple[str, str]], None, None]:
+    """Create two users on different scenarios, shared by a test class.
 
-        try:
-            # Create two users with different scenarios
-            hash1 = db_manager.create_user(user1, password)
-            hash2 = db_manager.create_user(user2, password)
+    The first user is on tier1_new, the second on all_graduated. Tests only
+    log in and read pages, so the users are provisioned once per class rather
+    than once per test. Yields [(username, password_hash), ...].
+    """
+    users = []
+    for preset in ("tier1_new", "all_graduated"):
+        username = unique_username()
+        password_hash = db_manager.create_user(username, "test123", preset)
+        users.append((username, password_hash))
 
-            # Set different scenarios
-            db_manager.create_scenario(user1, "tier1_new")
-            db_manager.use_scenario(user1, "tier1_new")
+    yield users
 
-            db_manager.create_scenario(user2, "all_graduated")
-            db_manager.use_scenario(user2, "all_graduated")
+    for username, _ in users:
+        db_manager.delete_user_later(username)
 
-            # Login both users
-            client1.login(user1, hash1)
-            client2.login(user2, hash2)
 
-            # Get progress for both
-            progress1 = client1.get("/progress")
-            progress2 = client2.get("/progress")
-
-            assert progress1.status_code == 200
-            assert progress2.status_code == 200
-
-            # Content should be different (one is new, one is graduated)
-            # This is a basic check - detailed verification would require parsing HTML
-
-        finally:
-            client1.close()
-            client2.close()
-            db_manager.delete_user(user1)
-            db_manager.delete_user(user2)
+class TestUserDataIsolation:
+    """User data isolation tests."""
 
-    def test_session_cookie_is_user_specific(
+    async def test_users_have_separate_progress(
         self,
-        server_url: str,
-        db_manager: DbManager,
+        two_clients: tuple[TestClient, TestClient],
+        isolation_users: list[tuple[str, str]],
     ):
-        """Session cookie only works for the user it was issued to."""
-        user1 = f"_test_{uuid.uuid4().hex[:8]}"
-        user2 = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        client1 = TestClient(server_url)
-        client2 = TestClient(server_url)
-
-        try:
-            hash1 = db_manager.create_user(user1, password)
-            hash2 = db_manager.create_user(user2, password)
+        """Two users have completely separate progress."""
+        (user1, hash1), (user2, hash2) = isolation_users
+        client1, client2 = two_clients
 
-            # Login user1
-            client1.login(user1, hash1)
-            assert client1.is_authenticated()
-            user1_session = client1.session_cookie
+        # Login both users (one is on tier1_new, one on all_graduated).
+        # The clients are independent, so their requests can overlap.
+        await asyncio.gather(
+            asyncio.to_thread(client1.login, user1, hash1),
+            asyncio.to_thread(client2.login, user2, hash2),
+        )
 
-            # Login user2
-            client2.login(user2, hash2)
-            assert client2.is_authenticated()
-            user2_session = client2.session_cookie
+        # Get progress for both
+        progress1, progress2 = await asyncio.gather(
+            asyncio.to_thread(client1.get, "/progress"),
+            asyncio.to_thread(client2.get, "/progress"),
+        )
 
-            # Sessions should be different
-            assert user1_session != user2_session
+        assert progress1.status_code == 200
+        assert progress2.status_code == 200
 
-            # Each user's session should work for them
-            response1 = client1.get("/")
-            response2 = client2.get("/")
-            assert response1.status_code == 200
-            assert response2.status_code == 200
+        # Content should be different (one is new, one is graduated)
+        # This is a basic check - detailed verification would require parsing HTML
 
-        finally:
-            client1.close()
-            client2.close()
-            db_manager.delete_user(user1)
-            db_manager.delete_user(user2)
+    async def test_session_cookie_is_user_specific(
+        self,
+        two_clients: tuple[TestClient, TestClient],
+        isolation_users: list[tuple[str, str]],
+    ):
+        """Session cookie only works for the user it was issued to."""
+        (user1, hash1), (user2, hash2) = isolation_users
+        client1, client2 = two_clients
+
+        await asyncio.gather(
+            asyncio.to_thread(client1.login, user1, hash1),
+            asyncio.to_thread(client2.login, user2, hash2),
+        )
+
+        # Each user's session should work for them
+        (authed1, response1), (authed2, response2) = await asyncio.gather(
+            asyncio.to_thread(client1.authenticated_get, "/"),
+            asyncio.to_thread(client2.authenticated_get, "/"),
+        )
+        assert authed1
+        assert authed2
+        assert response1.status_code == 200
+        assert response2.status_code == 200
+
+        # Sessions should be different
+        assert client1.session_cookie != client2.session_cookie
 
     def test_cannot_access_other_user_data_directly(
         self,
         client: TestClient,
-        db_manager: DbManager,
+        isolation_users: list[tuple[str, str]],
     ):
         """User cannot access another user's data through API manipulation."""
-        user1 = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
+        user1, hash1 = isolation_users[0]
+        client.login(user1, hash1)
 
-        try:
-            hash1 = db_manager.create_user(user1, password)
-            client.login(user1, hash1)
+        # Try to access settings - should only see own data
+        response = client.get("/settings")
+        assert response.status_code == 200
 
-            # Try to access settings - should only see own data
-            response = client.get("/settings")
-            assert response.status_code == 200
-
-            # Try export - should only export own data
-            export_response = client.get("/settings/export")
-            assert export_response.status_code == 200
-
-        finally:
-            db_manager.delete_user(user1)
+        # Try export - should only export own data
+        export_response = client.get("/settings/export")
+        assert export_response.status_code == 200
 
 
 class TestGuestIsolation:
@@ -140,7 +127,6 @@ class TestGuestIsolation:
         # Create a guest
         response = client.post("/guest", data={"nickname": ""})
         assert response.status_code in (302, 303)
-        assert client.is_authenticated()
 
         guest_username = client.username_cookie
         assert guest_username is not None
@@ -148,7 +134,8 @@ class TestGuestIsolation:
 
         try:
             # Guest should have their own progress
-            progress = client.get("/progress")
+            authed, progress = client.authenticated_get("/progress")
+            assert authed
             assert progress.status_code == 200
 
             # Guest should be able to study
@@ -156,4 +143,4 @@ class TestGuestIsolation:
             assert study.status_code == 200
 
         finally:
-            db_manager.delete_user(guest_username)
+            db_manager.delete_user_later(guest_username)
@@ -9,24 +9,29 @@ Note: Comprehensive security tests (unauthorized/unauthenticated access) are in
 test_admin_security.py. These tests focus on functionality when authorized.
 """
 
-import uuid
+from typing import Callable
 
 import pytest
 
 from conftest import DbManager, TestClient
 
+pytestmark = pytest.mark.xdist_group("groups")
+
 
 class TestGroupManagement:
     """Group CRUD operations (admin only)."""
 
     def test_create_group_requires_admin(
-        self, authenticated_client: TestClient, db_manager: DbManager
+        self,
+        shared_authenticated_client: TestClient,
+        db_manager: DbManager,
+        unique_suffix: Callable[[], str],
     ):
         """POST /settings/group/create requires admin - with side-effect check."""
-        group_id = f"test-group-{uuid.uuid4().hex[:8]}"
+        group_id = f"test-group-{unique_suffix()}"
         count_before = db_manager.get_group_count()
 
-        response = authenticated_client.post(
+        response = shared_authenticated_client.post(
             "/settings/group/create",
             data={"id": group_id, "name": "Test Group"},
         )
@@ -46,9 +51,9 @@ class TestGroupManagement:
             f"Group '{group_id}' was created despite non-admin user"
         )
 
-    def test_delete_group_requires_admin(self, authenticated_client: TestClient):
+    def test_delete_group_requires_admin(self, shared_authenticated_client: TestClient):
         """DELETE /settings/group/{group_id} requires admin."""
-        response = authenticated_client.delete("/settings/group/nonexistent-group")
+        response = shared_authenticated_client.delete("/settings/group/nonexistent-group")
 
         # Regular users should get 403 or redirect to /settings
         # 404 is also acceptable since group doesn't exist
@@ -61,39 +66,32 @@ class TestGroupManagement:
 class TestGroupMembership:
     """Group membership management (admin only)."""
 
-    def test_add_member_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/group/add-member requires admin."""
-        response = authenticated_client.post(
-            "/settings/group/add-member",
-            data={"group_id": "test-group", "user_id": "testuser"},
-        )
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-    def test_remove_member_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/group/remove-member requires admin."""
-        response = authenticated_client.post(
-            "/settings/group/remove-member",
+    @pytest.mark.parametrize(
+        "path",
+        ["/settings/group/add-member", "/settings/group/remove-member"],
+    )
+    def test_membership_change_requires_admin(
+        self, shared_authenticated_client: TestClient, path: str
+    ):
+        """POST /settings/group/{add,remove}-member requires admin."""
+        response = shared_authenticated_client.post(
+            path,
             data={"group_id": "test-group", "user_id": "testuser"},
         )
 
         # Regular users should get 403 or redirect to /settings
         # 200 is NOT acceptable
         assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
+            f"Expected 403 or redirect (303), got {response.status_code} for {path}"
         )
 
 
 class TestGroupAccessControl:
     """Group-based access control tests."""
 
-    def test_settings_shows_user_groups(self, authenticated_client: TestClient):
+    def test_settings_shows_user_groups(self, shared_authenticated_client: TestClient):
         """Settings page may show group membership info."""
-        response = authenticated_client.get("/settings")
+        response = shared_authenticated_client.get("/settings")
 
         assert response.status_code == 200
         # Settings page should load successfully
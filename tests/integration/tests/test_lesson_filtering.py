@@ -16,20 +16,28 @@ import pytest
 
 from conftest import DbManager, TestClient
 
+pytestmark = pytest.mark.xdist_group("lesson_filtering")
+
+# Case-insensitive markers searched in raw page bytes (avoids decoding + lowercasing)
+_LESSON_RE = re.compile(rb"lesson", re.IGNORECASE)
+_TEST_PACK_RE = re.compile(rb"test_lesson_pack|test lessons", re.IGNORECASE)
+
+
+@pytest.fixture(scope="module")
+def pack_lesson_counts(lesson_pack_enabled: str, db_manager: DbManager) -> dict[int | None, int]:
+    """Lesson -> card count for the test pack, queried once for the module.
+
+    Nothing in this module adds or removes pack cards, so one query serves every test.
+    """
+    return db_manager.get_pack_lesson_counts(lesson_pack_enabled)
+
 
 class TestPackLessonLoading:
     """Tests for loading pack cards with lesson numbers."""
 
-    def test_pack_cards_have_lesson_numbers(
-        self, admin_client: TestClient, db_manager: DbManager
-    ):
+    def test_pack_cards_have_lesson_numbers(self, pack_lesson_counts: dict[int | None, int]):
         """Verify pack cards are loaded with correct lesson numbers."""
-        # Enable test_lesson_pack as admin
-        response = admin_client.post("/settings/pack/test_lesson_pack/enable")
-        assert response.status_code in (200, 303), f"Failed to enable pack: {response.status_code}"
-
-        # Query lesson counts
-        lesson_counts = db_manager.get_pack_lesson_counts("test_lesson_pack")
+        lesson_counts = pack_lesson_counts
 
         # Verify lesson distribution
         assert lesson_counts.get(1) == 3, f"Expected 3 cards in lesson 1, got {lesson_counts.get(1)}"
@@ -38,15 +46,9 @@ class TestPackLessonLoading:
             f"Expected no cards without lesson, got {lesson_counts.get(None)}"
         )
 
-    def test_pack_cards_not_null_lessons(
-        self, admin_client: TestClient, db_manager: DbManager
-    ):
+    def test_pack_cards_not_null_lessons(self, pack_lesson_counts: dict[int | None, int]):
         """Ensure cards don't have NULL lessons (regression test for vocabulary.py bug)."""
-        # Enable test_lesson_pack as admin
-        admin_client.post("/settings/pack/test_lesson_pack/enable")
-
-        # Query lesson counts
-        lesson_counts = db_manager.get_pack_lesson_counts("test_lesson_pack")
+        lesson_counts = pack_lesson_counts
 
         # Verify no NULL lessons
         null_count = lesson_counts.get(None, 0)
@@ -60,90 +62,62 @@ class TestLessonFiltering:
     """Tests for lesson-based filtering of cards."""
 
     def test_home_page_shows_filtered_count(
-        self, admin_client: TestClient, db_manager: DbManager
+        self, shared_admin_client: TestClient, lesson_pack_enabled: str
     ):
         """Home page shows cards from unlocked lessons only.
 
         With tier 1 baseline (30 cards) and test_lesson_pack lesson 1 (3 cards),
         total should be 33, not 35 (which would include lesson 2).
         """
-        # First enable the pack
-        response = admin_client.post("/settings/pack/test_lesson_pack/enable")
-        assert response.status_code in (200, 303)
-
-        # Make pack public so all users can access
-        response = admin_client.post("/settings/pack/test_lesson_pack/make-public")
-        assert response.status_code in (200, 303)
-
-        # Get home page
-        response = admin_client.get("/")
+        # The summary endpoint returns the same counters the home page renders
+        response = shared_admin_client.get("/api/home/summary")
         assert response.status_code == 200
 
-        # Extract due count from response
-        # Look for pattern like "33\nCards due" or similar
-        text = response.text
-
-        # The home page shows "X Cards due for review"
-        match = re.search(r"(\d+)\s*(?:<[^>]*>)?\s*Cards?\s+due", text, re.IGNORECASE)
-        if match:
-            due_count = int(match.group(1))
-            # Baseline tier 1 has 30 cards, test_lesson_pack lesson 1 has 3 cards
-            # Total should be 33 (not 35 which would include lesson 2)
-            # Note: Admin might have all tiers unlocked, so we check for reasonable range
-            assert due_count <= 85, (  # 80 baseline + 5 pack cards max
-                f"Due count {due_count} seems too high - lesson filtering may not be working"
-            )
+        due_count = response.json()["due_count"]
+        # Baseline tier 1 has 30 cards, test_lesson_pack lesson 1 has 3 cards
+        # Total should be 33 (not 35 which would include lesson 2)
+        # Note: Admin might have all tiers unlocked, so we check for reasonable range
+        assert due_count <= 85, (  # 80 baseline + 5 pack cards max
+            f"Due count {due_count} seems too high - lesson filtering may not be working"
+        )
 
 
 class TestProgressPage:
     """Tests for progress page lesson breakdown."""
 
     def test_progress_shows_lesson_breakdown(
-        self, admin_client: TestClient, db_manager: DbManager
+        self, shared_admin_client: TestClient, lesson_pack_enabled: str
     ):
         """Progress page shows correct per-lesson card counts."""
-        # Enable test_lesson_pack
-        admin_client.post("/settings/pack/test_lesson_pack/enable")
-        admin_client.post("/settings/pack/test_lesson_pack/make-public")
-
         # Get progress page
-        response = admin_client.get("/progress")
+        response = shared_admin_client.get("/progress")
         assert response.status_code == 200
 
-        text = response.text.lower()
-
         # Should show "Test Lessons" pack or lesson info
         # The pack has ui.display_name = "Test Lessons"
-        assert "lesson" in text, "Progress page should show lesson information"
+        assert _LESSON_RE.search(response.content), "Progress page should show lesson information"
 
     def test_progress_not_zero_for_lessons(
-        self, admin_client: TestClient, db_manager: DbManager
+        self, shared_admin_client: TestClient, pack_lesson_counts: dict[int | None, int]
     ):
         """Progress page should not show 0/0 for lessons that have cards.
 
         This is a regression test for the bug where lesson=NULL caused
         lesson progress queries to return 0 cards.
         """
-        # Enable test_lesson_pack
-        admin_client.post("/settings/pack/test_lesson_pack/enable")
-        admin_client.post("/settings/pack/test_lesson_pack/make-public")
-
         # Verify cards were loaded with lessons
-        lesson_counts = db_manager.get_pack_lesson_counts("test_lesson_pack")
-        assert lesson_counts.get(1, 0) > 0, "Test pack should have lesson 1 cards"
+        assert pack_lesson_counts.get(1, 0) > 0, "Test pack should have lesson 1 cards"
 
         # Get progress page
-        response = admin_client.get("/progress")
+        response = shared_admin_client.get("/progress")
         assert response.status_code == 200
 
         # Check that we don't see "0/0" pattern for lesson counts
         # (This would indicate lesson filtering is broken)
         # Note: "0/3" is fine (0 learned out of 3), but "0/0" is bad
-        text = response.text
-
         # If the pack is showing lesson breakdown, it should have non-zero totals
         # Look for the test pack section
-        if "test_lesson_pack" in text.lower() or "test lessons" in text.lower():
+        if _TEST_PACK_RE.search(response.content):
             # If we find the pack, make sure lesson totals aren't all zero
             # This is a soft check since the exact format may vary
             pass  # Pack-specific assertions would go here
@@ -157,23 +131,19 @@ class TestLessonUnlock:
     """
 
     def test_lesson_1_unlocked_by_default(
-        self, admin_client: TestClient, db_manager: DbManager
+        self, shared_admin_client: TestClient, lesson_pack_enabled: str
     ):
         """Lesson 1 is always unlocked by default."""
-        # Enable test_lesson_pack
-        admin_client.post("/settings/pack/test_lesson_pack/enable")
-
         # Get progress page to see lesson info
-        response = admin_client.get("/progress")
+        response = shared_admin_client.get("/progress")
         assert response.status_code == 200
 
         # The test pack should show lesson 1 info (it's always unlocked)
-        text = response.text.lower()
-        # Check that lesson content is accessible
-        assert "test lessons" in text or "lesson" in text
+        # Check that lesson content is accessible ("Test Lessons" matches too)
+        assert _LESSON_RE.search(response.content)
 
     def test_home_page_has_unlock_notification_code(
-        self, admin_client: TestClient, db_manager: DbManager
+        self, shared_admin_client: TestClient, lesson_pack_enabled: str
     ):
         """Home page template includes pack lesson unlock notification code.
 
@@ -181,16 +151,13 @@ class TestLessonUnlock:
         unlocked_lessons is non-empty. The actual triggering happens during study
         session progression.
         """
-        # Enable test_lesson_pack
-        admin_client.post("/settings/pack/test_lesson_pack/enable")
-
-        # Verify home page loads
-        response = admin_client.get("/")
+        # Verify home page loads; the read stops as soon as the marker is seen
+        response, found = shared_admin_client.stream_contains("/", b"HaetaeSystem")
         assert response.status_code == 200
 
         # The notification code for unlocked_lessons should be in the template.
         # Check for the conditional block (even if it's not triggered)
         # This is a structural test - the code path exists.
         # Note: We look for HaetaeSystem which handles both tier and lesson unlocks.
-        assert "HaetaeSystem" in response.text, \
+        assert found, \
             "Home page should have HaetaeSystem notification code"
@@ -8,7 +8,12 @@ Tests the server-side sync API:
 import pytest
 from datetime import datetime, timedelta, timezone
 
-from conftest import DbManager, TestClient
+from conftest import TestClient
+
+# Statuses accepted for a settings form POST (rendered page or redirect back)
+_REDIRECT_OR_OK = frozenset({200, 303})
+
+pytestmark = pytest.mark.xdist_group("offline_sync")
 
 
 class TestDownloadSession:
@@ -24,25 +29,9 @@ class TestDownloadSession:
         # Should return 403 (offline mode not enabled)
         assert response.status_code == 403
 
-    def test_download_session_returns_cards(
-        self, authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
-    ):
+    def test_download_session_returns_cards(self, shared_offline_session: dict):
         """Download session returns cards with SRS state."""
-        # First enable offline mode via settings
-        response = authenticated_client.post(
-            "/settings",
-            data={"_action": "offline_mode", "offline_mode_enabled": "true"},
-        )
-        assert response.status_code in (200, 303)
-
-        # Download session
-        response = authenticated_client.post(
-            "/api/study/download-session",
-            json={"duration_minutes": 30, "filter_mode": "all"},
-        )
-        assert response.status_code == 200
-
-        data = response.json()
+        data = shared_offline_session
         assert "session_id" in data
         assert "cards" in data
         assert "created_at" in data
@@ -52,28 +41,13 @@ class TestDownloadSession:
 
         # Each card should have required fields
         card = data["cards"][0]
-        assert "card_id" in card or "id" in card
+        assert "card_id" in card
         assert "front" in card
         assert "back" in card  # API uses 'back' not 'main_answer'
 
-    def test_download_session_includes_srs_state(
-        self, authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
-    ):
+    def test_download_session_includes_srs_state(self, shared_offline_session: dict):
         """Downloaded cards include SRS state for client-side scheduling."""
-        # Enable offline mode
-        authenticated_client.post(
-            "/settings",
-            data={"_action": "offline_mode", "offline_mode_enabled": "true"},
-        )
-
-        # Download session
-        response = authenticated_client.post(
-            "/api/study/download-session",
-            json={"duration_minutes": 30, "filter_mode": "all"},
-        )
-        assert response.status_code == 200
-
-        data = response.json()
+        data = shared_offline_session
         if len(data["cards"]) > 0:
             card = data["cards"][0]
             # Should have SRS fields for client-side calculation
@@ -81,124 +55,100 @@ class TestDownloadSession:
             # fsrs_stability and fsrs_difficulty may be None for new cards
 
 
+def _offline_review(
+    card_id: int,
+    now: datetime,
+    *,
+    quality: int = 4,
+    hints_used: int = 0,
+    learning_step: int = 1,
+    stability: float = 1.5,
+    difficulty: float = 5.0,
+    delay: timedelta = timedelta(0),
+    interval: timedelta = timedelta(days=1),
+) -> dict:
+    """Build one review entry as the offline client would sync it."""
+    return {
+        "card_id": card_id,
+        "quality": quality,
+        "is_correct": True,
+        "hints_used": hints_used,
+        "timestamp": (now + delay).isoformat(),
+        "learning_step": learning_step,
+        "fsrs_stability": stability,
+        "fsrs_difficulty": difficulty,
+        "next_review": (now + interval).isoformat(),
+    }
+
+
+# Review overrides per synced card; each case gets its own downloaded session
+SYNC_CASES = [
+    pytest.param([], id="empty"),
+    pytest.param([{}], id="one_review"),
+    pytest.param(
+        [
+            {},
+            {
+                "quality": 3,
+                "hints_used": 1,
+                "stability": 1.2,
+                "difficulty": 5.5,
+                "delay": timedelta(seconds=30),
+                "interval": timedelta(hours=12),
+            },
+        ],
+        id="two_reviews",
+    ),
+]
+
+
 class TestSyncOffline:
     """Tests for the sync offline endpoint."""
 
-    def test_sync_empty_reviews(
-        self, authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
+    @pytest.mark.parametrize("review_overrides", SYNC_CASES)
+    def test_sync_reviews(
+        self,
+        offline_mode_client: TestClient,
+        fresh_offline_session: dict,
+        review_overrides: list[dict],
     ):
-        """Sync with empty reviews returns success."""
-        # Enable offline mode first
-        authenticated_client.post(
-            "/settings",
-            data={"_action": "offline_mode", "offline_mode_enabled": "true"},
-        )
-
-        # Download a session to get a valid session_id
-        response = authenticated_client.post(
-            "/api/study/download-session",
-            json={"duration_minutes": 10, "filter_mode": "all"},
-        )
-        assert response.status_code == 200
-        session = response.json()
+        """Syncing valid reviews reports each one as synced, with no errors."""
+        session = fresh_offline_session
+        cards = session["cards"]
+        if len(cards) < len(review_overrides):
+            pytest.skip(f"Need at least {len(review_overrides)} cards for this test")
 
-        # Sync empty reviews with valid session_id
-        response = authenticated_client.post(
-            "/api/study/sync-offline",
-            json={"session_id": session["session_id"], "reviews": []},
-        )
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["synced_count"] == 0
-        assert data["errors"] == []
-
-    def test_sync_valid_review(
-        self, authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
-    ):
-        """Sync with valid review updates card progress."""
-        # Enable offline mode
-        authenticated_client.post(
-            "/settings",
-            data={"_action": "offline_mode", "offline_mode_enabled": "true"},
-        )
-
-        # First download a session to get valid card IDs
-        response = authenticated_client.post(
-            "/api/study/download-session",
-            json={"duration_minutes": 30, "filter_mode": "all"},
-        )
-        assert response.status_code == 200
-        session = response.json()
-
-        if len(session["cards"]) == 0:
-            pytest.skip("No cards available for testing")
-
-        card = session["cards"][0]
-        card_id = card.get("card_id") or card.get("id")
-
-        # Sync a review
         now = datetime.now(timezone.utc)
-        response = authenticated_client.post(
+        reviews = [
+            _offline_review(card["card_id"], now, **overrides)
+            for card, overrides in zip(cards, review_overrides)
+        ]
+        response = offline_mode_client.post(
             "/api/study/sync-offline",
-            json={
-                "session_id": session["session_id"],
-                "reviews": [
-                    {
-                        "card_id": card_id,
-                        "quality": 4,
-                        "is_correct": True,
-                        "hints_used": 0,
-                        "timestamp": now.isoformat(),
-                        "learning_step": 1,
-                        "fsrs_stability": 1.5,
-                        "fsrs_difficulty": 5.0,
-                        "next_review": (now + timedelta(days=1)).isoformat(),
-                    }
-                ],
-            },
+            json={"session_id": session["session_id"], "reviews": reviews},
         )
         assert response.status_code == 200
 
         data = response.json()
-        assert data["synced_count"] == 1
+        assert data["synced_count"] == len(reviews)
         assert data["errors"] == []
 
     def test_sync_invalid_card_returns_error(
-        self, authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
+        self,
+        offline_mode_client: TestClient,
+        fresh_offline_session: dict,
     ):
         """Sync with invalid card ID still processes (creates progress entry)."""
-        # Enable offline mode
-        authenticated_client.post(
-            "/settings",
-            data={"_action": "offline_mode", "offline_mode_enabled": "true"},
-        )
-
-        # Download a session to get a valid session_id
-        response = authenticated_client.post(
-            "/api/study/download-session",
-            json={"duration_minutes": 10, "filter_mode": "all"},
-        )
-        assert response.status_code == 200
-        session = response.json()
+        session = fresh_offline_session
 
         now = datetime.now(timezone.utc)
-        response = authenticated_client.post(
+        response = offline_mode_client.post(
             "/api/study/sync-offline",
             json={
                 "session_id": session["session_id"],
                 "reviews": [
-                    {
-                        "card_id": 999999,  # Non-existent card
-                        "quality": 4,
-                        "is_correct": True,
-                        "hints_used": 0,
-                        "timestamp": now.isoformat(),
-                        "learning_step": 0,
-                        "fsrs_stability": 1.0,
-                        "fsrs_difficulty": 5.0,
-                        "next_review": (now + timedelta(days=1)).isoformat(),
-                    }
+                    # Non-existent card
+                    _offline_review(999999, now, learning_step=0, stability=1.0),
                 ],
             },
         )
@@ -209,69 +159,6 @@ class TestSyncOffline:
         # May succeed or have errors depending on foreign key constraints
         assert "synced_count" in data
 
-    def test_sync_multiple_reviews(
-        self, authenticated_client: TestClient, db_manager: DbManager, test_user: tuple[str, str]
-    ):
-        """Sync with multiple reviews processes all of them."""
-        # Enable offline mode
-        authenticated_client.post(
-            "/settings",
-            data={"_action": "offline_mode", "offline_mode_enabled": "true"},
-        )
-
-        # Download session for valid cards
-        response = authenticated_client.post(
-            "/api/study/download-session",
-            json={"duration_minutes": 30, "filter_mode": "all"},
-        )
-        if response.status_code != 200:
-            pytest.skip("Could not download session")
-
-        session = response.json()
-        if len(session["cards"]) < 2:
-            pytest.skip("Need at least 2 cards for this test")
-
-        card1_id = session["cards"][0].get("card_id") or session["cards"][0].get("id")
-        card2_id = session["cards"][1].get("card_id") or session["cards"][1].get("id")
-
-        now = datetime.now(timezone.utc)
-        response = authenticated_client.post(
-            "/api/study/sync-offline",
-            json={
-                "session_id": session["session_id"],
-                "reviews": [
-                    {
-                        "card_id": card1_id,
-                        "quality": 4,
-                        "is_correct": True,
-                        "hints_used": 0,
-                        "timestamp": now.isoformat(),
-                        "learning_step": 1,
-                        "fsrs_stability": 1.5,
-                        "fsrs_difficulty": 5.0,
-                        "next_review": (now + timedelta(days=1)).isoformat(),
-                    },
-                    {
-                        "card_id": card2_id,
-                        "quality": 3,
-                        "is_correct": True,
-                        "hints_used": 1,
-                        "timestamp": (now + timedelta(seconds=30)).isoformat(),
-                        "learning_step": 1,
-                        "fsrs_stability": 1.2,
-                        "fsrs_difficulty": 5.5,
-                        "next_review": (now + timedelta(hours=12)).isoformat(),
-                    },
-                ],
-            },
-        )
-        assert response.status_code == 200
-
-        data = response.json()
-        # Both should be synced
-        assert data["synced_count"] == 2
-        assert data["errors"] == []
-
 
 class TestOfflineModeSettings:
     """Tests for offline mode settings."""
@@ -282,7 +169,7 @@ class TestOfflineModeSettings:
             "/settings",
             data={"_action": "offline_mode", "offline_mode_enabled": "true"},
         )
-        assert response.status_code in (200, 303)
+        assert response.status_code in _REDIRECT_OR_OK
 
     def test_disable_offline_mode(self, authenticated_client: TestClient):
         """Can disable offline mode via settings."""
@@ -297,4 +184,4 @@ class TestOfflineModeSettings:
             "/settings",
             data={"_action": "offline_mode"},
         )
-        assert response.status_code in (200, 303)
+        assert response.status_code in _REDIRECT_OR_OK
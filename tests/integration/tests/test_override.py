@@ -6,12 +6,18 @@ These tests verify the override ruling fix (Track A):
 3. Override updates existing review log instead of creating new one
 """
 
-import re
-import time
+from datetime import datetime, timezone
+
 import pytest
 
 from conftest import DbManager, TestClient
 
+pytestmark = [
+    pytest.mark.xdist_group("override"),
+    pytest.mark.slow,
+    pytest.mark.scenario("tier1_new"),
+]
+
 
 class TestOverrideRuling:
     """Tests for override ruling functionality."""
@@ -20,6 +26,7 @@ class TestOverrideRuling:
         self,
         client: TestClient,
         db_manager: DbManager,
+        tier1_user: tuple[str, str],
     ):
         """After override to Correct, card should NOT be immediately due.
 
@@ -29,147 +36,110 @@ class TestOverrideRuling:
         Fix: After restoring pre-state, apply SRS calculation with the corrected
         quality, using the original review timestamp as the base.
         """
-        import uuid
-
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            # Create user with fresh state
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
-
-            # Login
-            client.login(username, password_hash)
-            assert client.is_authenticated()
-
-            # Get a card from study
-            study_response = client.get("/study")
-            assert study_response.status_code == 200
-
-            card_id_match = re.search(r'name="card_id"[^>]*value="(\d+)"', study_response.text)
-            session_id_match = re.search(r'name="session_id"[^>]*value="([^"]*)"', study_response.text)
-
-            if not card_id_match:
-                pytest.skip("No card available for test")
-
-            card_id = card_id_match.group(1)
-            session_id = session_id_match.group(1) if session_id_match else ""
-
-            # Answer WRONG first (quality=0)
-            validate_response = client.post(
-                "/validate-answer",
-                data={
-                    "card_id": card_id,
-                    "answer": "definitely_wrong_answer_xyz",
-                    "hints_used": 0,
-                    "session_id": session_id,
-                    "input_method": "text_input",
-                },
-            )
-            assert validate_response.status_code == 200
-
-            # Now override to Correct (quality=4)
-            override_response = client.post(
-                "/override-ruling",
-                data={
-                    "card_id": card_id,
-                    "session_id": session_id,
-                    "quality": 4,
-                    "suggested_answer": "",
-                    "card_front": "",
-                    "expected_answer": "",
-                    "user_answer": "definitely_wrong_answer_xyz",
-                    "original_result": "incorrect",
-                },
-            )
-            assert override_response.status_code == 200
-
-            # Get next card - the overridden card should NOT be immediately due
-            next_response = client.post(
-                "/next-card",
-                data={"session_id": session_id},
-            )
-            assert next_response.status_code == 200
-
-            # Extract the next card_id
-            next_card_id_match = re.search(r'data-card-id="(\d+)"', next_response.text)
-            if next_card_id_match:
-                next_card_id = next_card_id_match.group(1)
-                # The overridden card should NOT be the next card shown
-                # (unless it's the only card, which is why we need a scenario with multiple cards)
-                # This is a basic check - ideally we'd verify the next_review timestamp in DB
-                pass
-
-        finally:
-            db_manager.delete_user(username)
+        username, password_hash = tier1_user
+
+        # Login
+        client.login(username, password_hash)
+        assert client.is_authenticated()
+
+        # Get a card from study
+        card = client.study_card()
+        assert card is not None
+        assert card["card_id"] is not None
+
+        card_id = card["card_id"]
+        session_id = card["session_id"]
+
+        # Answer WRONG first (quality=0)
+        validate_response = client.post(
+            "/validate-answer",
+            data={
+                "card_id": card_id,
+                "answer": "definitely_wrong_answer_xyz",
+                "hints_used": 0,
+                "session_id": session_id,
+                "input_method": "text_input",
+            },
+        )
+        assert validate_response.status_code == 200
+
+        # Now override to Correct (quality=4)
+        override_response = client.post(
+            "/override-ruling",
+            data={
+                "card_id": card_id,
+                "session_id": session_id,
+                "quality": 4,
+                "suggested_answer": "",
+                "card_front": "",
+                "expected_answer": "",
+                "user_answer": "definitely_wrong_answer_xyz",
+                "original_result": "incorrect",
+            },
+        )
+        assert override_response.status_code == 200
+
+        # The corrected SRS state schedules the card in the future
+        next_review = db_manager.get_next_review(username, card_id)
+        assert next_review is not None, "Override left the card without progress"
+        assert next_review > datetime.now(timezone.utc), (
+            f"Card {card_id} is due again immediately (next_review={next_review})"
+        )
+
+        # So the next card shown is a different one (tier 1 has plenty of cards)
+        next_card = client.study_card(session_id)
+        assert next_card is not None
+        assert next_card["card_id"] != card_id
 
     def test_override_updates_review_log_quality(
         self,
         client: TestClient,
         db_manager: DbManager,
+        tier1_user: tuple[str, str],
     ):
         """Override should update the existing review log, not create a new override entry.
 
         Fix: Call update_latest_review_quality instead of insert_review_log_enhanced.
         """
-        import uuid
-
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            # Create user
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
-
-            # Login
-            client.login(username, password_hash)
-            assert client.is_authenticated()
-
-            # Get a card
-            study_response = client.get("/study")
-            assert study_response.status_code == 200
-
-            card_id_match = re.search(r'name="card_id"[^>]*value="(\d+)"', study_response.text)
-            session_id_match = re.search(r'name="session_id"[^>]*value="([^"]*)"', study_response.text)
-
-            if not card_id_match:
-                pytest.skip("No card available for test")
-
-            card_id = card_id_match.group(1)
-            session_id = session_id_match.group(1) if session_id_match else ""
-
-            # Answer wrong
-            client.post(
-                "/validate-answer",
-                data={
-                    "card_id": card_id,
-                    "answer": "wrong",
-                    "hints_used": 0,
-                    "session_id": session_id,
-                    "input_method": "text_input",
-                },
-            )
-
-            # Override to Easy (quality=5)
-            override_response = client.post(
-                "/override-ruling",
-                data={
-                    "card_id": card_id,
-                    "session_id": session_id,
-                    "quality": 5,
-                },
-            )
-            assert override_response.status_code == 200
-
-            # We can't easily verify the DB from here without direct DB access
-            # But the test verifies the endpoint works without error
-
-        finally:
-            db_manager.delete_user(username)
+        username, password_hash = tier1_user
+
+        # Login
+        client.login(username, password_hash)
+        assert client.is_authenticated()
+
+        # Get a card
+        card = client.study_card()
+        assert card is not None
+        assert card["card_id"] is not None
+
+        card_id = card["card_id"]
+        session_id = card["session_id"]
+
+        # Answer wrong
+        client.post(
+            "/validate-answer",
+            data={
+                "card_id": card_id,
+                "answer": "wrong",
+                "hints_used": 0,
+                "session_id": session_id,
+                "input_method": "text_input",
+            },
+        )
+
+        # Override to Easy (quality=5)
+        override_response = client.post(
+            "/override-ruling",
+            data={
+                "card_id": card_id,
+                "session_id": session_id,
+                "quality": 5,
+            },
+        )
+        assert override_response.status_code == 200
+
+        # The single interactive review was rewritten; no override entry was added
+        assert db_manager.get_review_log(username, card_id) == [(5, "interactive")]
 
 
 class TestOverrideReinforcement:
@@ -178,7 +148,7 @@ class TestOverrideReinforcement:
     def test_override_correct_removes_from_reinforcement(
         self,
         client: TestClient,
-        db_manager: DbManager,
+        tier1_user: tuple[str, str],
     ):
         """After override to Correct, card should be removed from reinforcement queue.
 
@@ -187,80 +157,46 @@ class TestOverrideReinforcement:
 
         Fix: Call session.remove_from_reinforcement(card_id) when quality >= 2.
         """
-        import uuid
-
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            # Create user with multiple cards
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
-
-            # Login
-            client.login(username, password_hash)
-            assert client.is_authenticated()
-
-            # Get first card and answer WRONG
-            study_response = client.get("/study")
-            card_id_match = re.search(r'name="card_id"[^>]*value="(\d+)"', study_response.text)
-            session_id_match = re.search(r'name="session_id"[^>]*value="([^"]*)"', study_response.text)
-
-            if not card_id_match:
-                pytest.skip("No card available for test")
-
-            first_card_id = card_id_match.group(1)
-            session_id = session_id_match.group(1) if session_id_match else ""
-
-            # Answer wrong - adds card to reinforcement queue
-            client.post(
-                "/validate-answer",
-                data={
-                    "card_id": first_card_id,
-                    "answer": "wrong",
-                    "hints_used": 0,
-                    "session_id": session_id,
-                    "input_method": "text_input",
-                },
-            )
-
-            # Override to Correct - should remove from reinforcement
-            client.post(
-                "/override-ruling",
-                data={
-                    "card_id": first_card_id,
-                    "session_id": session_id,
-                    "quality": 4,
-                },
-            )
-
-            # Answer 3 more cards correctly (to trigger reinforcement check)
-            for _ in range(3):
-                next_resp = client.post("/next-card", data={"session_id": session_id})
-                if next_resp.status_code != 200:
-                    break
-
-                card_match = re.search(r'name="card_id"[^>]*value="(\d+)"', next_resp.text)
-                if not card_match:
-                    break
-
-                card_id = card_match.group(1)
-                # Answer correctly
-                client.post(
-                    "/validate-answer",
-                    data={
-                        "card_id": card_id,
-                        "answer": "any",  # Will likely be wrong but that's ok
-                        "hints_used": 0,
-                        "session_id": session_id,
-                        "input_method": "text_input",
-                    },
-                )
-
-            # After 3+ cards, if first card was in reinforcement, it would appear
-            # The test passes if the overridden card doesn't show up as reinforcement
-            # (hard to verify without DB access, but endpoint should work)
-
-        finally:
-            db_manager.delete_user(username)
+        username, password_hash = tier1_user
+
+        # Login
+        client.login(username, password_hash)
+        assert client.is_authenticated()
+
+        # Get first card and answer WRONG
+        card = client.study_card()
+        assert card is not None
+        assert card["card_id"] is not None
+
+        first_card_id = card["card_id"]
+        session_id = card["session_id"]
+
+        # Answer wrong - adds card to reinforcement queue
+        client.post(
+            "/validate-answer",
+            data={
+                "card_id": first_card_id,
+                "answer": "wrong",
+                "hints_used": 0,
+                "session_id": session_id,
+                "input_method": "text_input",
+            },
+        )
+
+        # Override to Correct - should remove from reinforcement
+        client.post(
+            "/override-ruling",
+            data={
+                "card_id": first_card_id,
+                "session_id": session_id,
+                "quality": 4,
+            },
+        )
+
+        # The session's reinforcement queue no longer holds the card
+        next_card = client.study_card(session_id)
+        assert next_card is not None
+        assert next_card["card_id"] != first_card_id
+        assert first_card_id not in next_card["reinforcement_queue"], (
+            f"Overridden card {first_card_id} is still queued for reinforcement"
+        )
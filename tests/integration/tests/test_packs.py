@@ -2,141 +2,50 @@
 
 Tests cover:
 - Pack discovery and display
-- Pack enable/disable
-- Pack permission management (admin)
-- Group-based access control
+- Admin guard on pack management routes (smoke check)
+- Per-user pack visibility
 
 Note: Comprehensive security tests (unauthorized/unauthenticated access) are in
-test_admin_security.py. These tests focus on functionality when authorized.
+test_admin_security.py, which probes every pack endpoint; don't repeat them here.
 """
 
-import uuid
+import re
 
-import pytest
+from conftest import TestClient, UserFactory
 
-from conftest import DbManager, TestClient
+_PACK_OR_CONTENT_RE = re.compile(rb"pack|content", re.I)
 
 
 class TestPackDiscovery:
     """Pack discovery and display tests."""
 
-    def test_settings_shows_packs(self, authenticated_client: TestClient):
+    def test_settings_shows_packs(self, shared_authenticated_client: TestClient):
         """Settings page displays available content packs."""
-        response = authenticated_client.get("/settings")
+        response = shared_authenticated_client.get("/settings")
 
         assert response.status_code == 200
         # Settings should have pack-related content
-        assert "pack" in response.text.lower() or "content" in response.text.lower()
+        assert _PACK_OR_CONTENT_RE.search(response.content)
 
 
-class TestPackEnableDisable:
-    """Pack enable/disable tests (admin only for global packs)."""
+class TestPackAdminEndpoints:
+    """Pack management endpoints reject regular users.
 
-    def test_enable_pack_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/{pack_id}/enable requires admin for global packs."""
-        response = authenticated_client.post("/settings/pack/test-pack/enable", data={})
+    The admin guard itself is unit-tested in src/auth/middleware.rs and every
+    pack endpoint is probed in test_admin_security.py; this is the smoke check
+    that the guard is wired into the pack routes.
+    """
 
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable - it could mean the action succeeded
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-    def test_disable_pack_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/{pack_id}/disable requires admin for global packs."""
-        response = authenticated_client.post("/settings/pack/test-pack/disable", data={})
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-
-class TestPackPermissions:
-    """Pack permission management tests (admin only)."""
-
-    def test_add_pack_permission_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/permission/add requires admin."""
-        response = authenticated_client.post(
-            "/settings/pack/permission/add",
-            data={"pack_id": "test-pack", "group_id": "test-group"},
-        )
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable - it could mean the action succeeded
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-    def test_remove_pack_permission_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/permission/remove requires admin."""
-        response = authenticated_client.post(
-            "/settings/pack/permission/remove",
-            data={"pack_id": "test-pack", "group_id": "test-group"},
-        )
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-    def test_make_pack_public_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/{pack_id}/make-public requires admin."""
-        response = authenticated_client.post(
-            "/settings/pack/test-pack/make-public",
-            data={},
-        )
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-    def test_make_pack_private_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/{pack_id}/make-private requires admin."""
-        response = authenticated_client.post(
-            "/settings/pack/test-pack/make-private",
-            data={},
-        )
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-
-class TestUserPackPermissions:
-    """Individual user pack permission tests."""
-
-    def test_add_user_permission_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/user-permission/add requires admin."""
-        response = authenticated_client.post(
+    def test_user_permission_change_requires_admin(
+        self, shared_authenticated_client: TestClient
+    ):
+        """POST /settings/pack/user-permission/add returns 403 for a regular user."""
+        response = shared_authenticated_client.post(
             "/settings/pack/user-permission/add",
             data={"pack_id": "test-pack", "user_id": "testuser"},
         )
 
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
-
-    def test_remove_user_permission_requires_admin(self, authenticated_client: TestClient):
-        """POST /settings/pack/user-permission/remove requires admin."""
-        response = authenticated_client.post(
-            "/settings/pack/user-permission/remove",
-            data={"pack_id": "test-pack", "user_id": "testuser"},
-        )
-
-        # Regular users should get 403 or redirect to /settings
-        # 200 is NOT acceptable
-        assert response.status_code in (303, 403), (
-            f"Expected 403 or redirect (303), got {response.status_code}"
-        )
+        assert response.status_code == 403
 
 
 class TestPackAccessControl:
@@ -145,19 +54,13 @@ class TestPackAccessControl:
     def test_user_only_sees_permitted_packs(
         self,
         client: TestClient,
-        db_manager: DbManager,
+        user_factory: UserFactory,
     ):
         """User only sees packs they have permission to access."""
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
+        username, password_hash = user_factory()
 
-        try:
-            password_hash = db_manager.create_user(username, password)
-            client.login(username, password_hash)
+        client.login(username, password_hash)
 
-            # Check settings page - should only show accessible packs
-            response = client.get("/settings")
-            assert response.status_code == 200
-
-        finally:
-            db_manager.delete_user(username)
+        # Check settings page - should only show accessible packs
+        response = client.get("/settings")
+        assert response.status_code == 200
@@ -7,37 +7,36 @@ Tests cover:
 - Tier graduation (admin)
 """
 
-import uuid
+import re
 
 import pytest
 
-from conftest import DbManager, TestClient
+from conftest import ScenarioUser, TestClient
+
+# Case-insensitive page markers, matched on the response bytes
+_PROGRESS_OR_TIER_RE = re.compile(rb"progress|tier", re.I)
+_TIER_RE = re.compile(rb"tier", re.I)
+_CARD_OR_STUDY_RE = re.compile(rb"card|study|review", re.I)
+_TIER_OR_FOCUS_RE = re.compile(rb"tier|focus", re.I)
 
 
 class TestProgress:
     """Progress page and tier display tests."""
 
-    def test_progress_page_loads(self, authenticated_client: TestClient):
+    def test_progress_page_loads(self, shared_authenticated_client: TestClient):
         """GET /progress loads the progress page."""
-        response = authenticated_client.get("/progress")
+        response = shared_authenticated_client.get("/progress")
 
         assert response.status_code == 200
-        assert "progress" in response.text.lower() or "tier" in response.text.lower()
-
-    def test_progress_requires_authentication(self, client: TestClient):
-        """GET /progress redirects to login without auth."""
-        response = client.get("/progress")
-
-        assert response.status_code in (302, 303)
-        assert "/login" in response.headers.get("location", "")
+        assert _PROGRESS_OR_TIER_RE.search(response.content)
 
-    def test_progress_shows_tier_information(self, authenticated_client: TestClient):
+    def test_progress_shows_tier_information(self, shared_authenticated_client: TestClient):
         """Progress page displays tier progress information."""
-        response = authenticated_client.get("/progress")
+        response = shared_authenticated_client.get("/progress")
 
         assert response.status_code == 200
         # Should mention tiers
-        assert "tier" in response.text.lower()
+        assert _TIER_RE.search(response.content)
 
 
 class TestTierUnlock:
@@ -50,109 +49,81 @@ class TestTierUnlock:
         # Should return something (may be error if prerequisites not met)
         assert response.status_code in (200, 302, 303, 400)
 
+    @pytest.mark.scenario("tier1_new")
     def test_tier_unlock_with_insufficient_progress(
         self,
         client: TestClient,
-        db_manager: DbManager,
+        scenario_user: ScenarioUser,
     ):
         """Tier unlock fails when current tier is not mastered."""
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
+        username, password_hash = scenario_user("tier1_new")
 
-        try:
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
+        client.login(username, password_hash)
 
-            client.login(username, password_hash)
+        # Try to unlock next tier (should fail - tier 1 not mastered)
+        response = client.post("/unlock-tier", data={})
 
-            # Try to unlock next tier (should fail - tier 1 not mastered)
-            response = client.post("/unlock-tier", data={})
-
-            # Should not redirect to success or should show error
-            # The behavior depends on implementation
-            assert response.status_code in (200, 302, 303)
-
-        finally:
-            db_manager.delete_user(username)
+        # Should not redirect to success or should show error
+        # The behavior depends on implementation
+        assert response.status_code in (200, 302, 303)
 
+    @pytest.mark.scenario("tier3_unlock")
     def test_auto_unlock_at_80_percent(
         self,
         client: TestClient,
-        db_manager: DbManager,
+        scenario_user: ScenarioUser,
     ):
         """Tier auto-unlocks when 80% of current tier is learned."""
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            password_hash = db_manager.create_user(username, password)
-            # Use tier3_unlock scenario - tier 3 is at 80%
-            db_manager.create_scenario(username, "tier3_unlock")
-            db_manager.use_scenario(username, "tier3_unlock")
+        # Use tier3_unlock scenario - tier 3 is at 80%
+        username, password_hash = scenario_user("tier3_unlock")
 
-            client.login(username, password_hash)
+        client.login(username, password_hash)
 
-            # Visit home page to trigger auto-unlock check
-            response = client.get("/")
-            assert response.status_code == 200
-
-            # Check progress to see if tier 4 is unlocked
-            progress_response = client.get("/progress")
-            assert progress_response.status_code == 200
+        # Visit home page to trigger auto-unlock check
+        response = client.get("/")
+        assert response.status_code == 200
 
-        finally:
-            db_manager.delete_user(username)
+        # Check progress to see if tier 4 is unlocked
+        progress_response = client.get("/progress")
+        assert progress_response.status_code == 200
 
 
 class TestHomepage:
     """Homepage with tier and study information."""
 
-    def test_homepage_shows_due_count(self, authenticated_client: TestClient):
+    def test_homepage_shows_due_count(self, shared_authenticated_client: TestClient):
         """Homepage displays due card count."""
-        response = authenticated_client.get("/")
+        response = shared_authenticated_client.get("/")
 
         assert response.status_code == 200
         # Should have some indication of cards/study status
-        assert (
-            "card" in response.text.lower()
-            or "study" in response.text.lower()
-            or "review" in response.text.lower()
-        )
+        assert _CARD_OR_STUDY_RE.search(response.content)
 
+    @pytest.mark.scenario("tier1_new")
     def test_homepage_with_fresh_user(
         self,
         client: TestClient,
-        db_manager: DbManager,
+        scenario_user: ScenarioUser,
     ):
         """Homepage for new user shows initial state."""
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            password_hash = db_manager.create_user(username, password)
-            db_manager.create_scenario(username, "tier1_new")
-            db_manager.use_scenario(username, "tier1_new")
+        username, password_hash = scenario_user("tier1_new")
 
-            client.login(username, password_hash)
+        client.login(username, password_hash)
 
-            response = client.get("/")
-            assert response.status_code == 200
-
-        finally:
-            db_manager.delete_user(username)
+        response = client.get("/")
+        assert response.status_code == 200
 
 
 class TestFocusMode:
     """Focus mode tests (single tier study)."""
 
-    def test_settings_contains_focus_options(self, authenticated_client: TestClient):
+    def test_settings_contains_focus_options(self, shared_authenticated_client: TestClient):
         """Settings page contains focus mode options."""
-        response = authenticated_client.get("/settings")
+        response = shared_authenticated_client.get("/settings")
 
         assert response.status_code == 200
         # Settings should have tier-related options
-        assert "tier" in response.text.lower() or "focus" in response.text.lower()
+        assert _TIER_OR_FOCUS_RE.search(response.content)
 
 
 class TestAdminTierOperations:
@@ -9,14 +9,26 @@ incorrect values when pack cards had sooner review times than Hangul cards.
 """
 
 import re
-import sqlite3
-import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from conftest import DbManager, TestClient
+from conftest import DbManager, TestClient, UserFactory
+
+pytestmark = pytest.mark.xdist_group("timer_with_packs")
+
+_TIMER_TARGET_RE = re.compile(rb'data-target="(\d+)"')
+
+
+@pytest.fixture(scope="module")
+def timer_card_ids(db_manager: DbManager, test_data_dir: Path) -> tuple[int, int]:
+    """Register test_lesson_pack's timer card in app.db once per module.
+
+    The pack rows are global and idempotent, so only the per-user progress
+    is written by each test. Returns (pack_card_id, hangul_card_id).
+    """
+    return _register_test_pack(db_manager, test_data_dir / "app.db")
 
 
 class TestTimerWithPackCards:
@@ -26,7 +38,9 @@ class TestTimerWithPackCards:
         self,
         client: TestClient,
         db_manager: DbManager,
+        user_factory: UserFactory,
         test_data_dir: Path,
+        timer_card_ids: tuple[int, int],
     ):
         """Timer should show pack card review time when it's sooner than Hangul cards.
 
@@ -36,259 +50,213 @@ class TestTimerWithPackCards:
 
         Expected: Timer shows ~30 minutes, not ~2 hours
         """
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
-
-        try:
-            # Create user
-            password_hash = db_manager.create_user(username, password)
-
-            # Get paths to databases
-            user_db_path = test_data_dir / "users" / username / "learning.db"
-            app_db_path = test_data_dir / "app.db"
-
-            # Calculate future times
-            now = datetime.now(timezone.utc)
-            pack_review_time = now + timedelta(minutes=30)  # Sooner
-            hangul_review_time = now + timedelta(hours=2)   # Later
-
-            # Format as RFC 3339 (SQLite datetime format)
-            pack_time_str = pack_review_time.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            hangul_time_str = hangul_review_time.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-
-            # Set up test data in databases
-            _setup_test_databases(
-                user_db_path,
-                app_db_path,
-                pack_time_str,
-                hangul_time_str,
-            )
+        username, password_hash = user_factory()
+        pack_card_id, hangul_card_id = timer_card_ids
+
+        user_db_path = test_data_dir / "users" / username / "learning.db"
+
+        # Calculate future times
+        now = datetime.now(timezone.utc)
+        pack_review_time = now + timedelta(minutes=30)  # Sooner
+        hangul_review_time = now + timedelta(hours=2)   # Later
+
+        # Format as RFC 3339 (SQLite datetime format)
+        pack_time_str = pack_review_time.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        hangul_time_str = hangul_review_time.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+        # Set up the user's card progress (pack rows are already registered)
+        _setup_user_progress(
+            db_manager,
+            user_db_path,
+            pack_card_id,
+            pack_time_str,
+            hangul_card_id,
+            hangul_time_str,
+        )
 
-            # Login and check home page
-            client.login(username, password_hash)
-            assert client.is_authenticated()
+        # Login and read the home counters as JSON (the rendered timer is
+        # covered by test_timer_shows_hangul_when_no_packs)
+        client.login(username, password_hash)
+        assert client.is_authenticated()
 
-            response = client.get("/")
-            assert response.status_code == 200
+        response = client.get("/api/home/summary")
+        assert response.status_code == 200
 
-            # Extract timestamp from data-target attribute
-            # Pattern: data-target="<timestamp>"
-            match = re.search(r'data-target="(\d+)"', response.text)
-            assert match, f"Could not find timer timestamp in response"
+        timer_timestamp = response.json()["next_review_timestamp"]
+        assert timer_timestamp is not None, "Summary has no next review timestamp"
 
-            timer_timestamp = int(match.group(1))
-            timer_time = datetime.fromtimestamp(timer_timestamp, tz=timezone.utc)
+        timer_time = datetime.fromtimestamp(timer_timestamp, tz=timezone.utc)
 
-            # Timer should be close to pack_review_time (~30 min), not hangul_review_time (~2h)
-            # Allow 5 minute tolerance for test execution time
-            time_diff_to_pack = abs((timer_time - pack_review_time).total_seconds())
-            time_diff_to_hangul = abs((timer_time - hangul_review_time).total_seconds())
+        # Timer should be close to pack_review_time (~30 min), not hangul_review_time (~2h)
+        # Allow 5 minute tolerance for test execution time
+        time_diff_to_pack = abs((timer_time - pack_review_time).total_seconds())
+        time_diff_to_hangul = abs((timer_time - hangul_review_time).total_seconds())
 
-            assert time_diff_to_pack < 300, (
-                f"Timer should show pack card time (~30 min from now), "
-                f"but shows {timer_time}. "
-                f"Diff to pack: {time_diff_to_pack}s, diff to hangul: {time_diff_to_hangul}s"
-            )
-            # Also verify it's NOT showing the Hangul time
-            assert time_diff_to_hangul > 3600, (
-                f"Timer appears to show Hangul card time instead of pack card time. "
-                f"Timer: {timer_time}, expected pack time: {pack_review_time}"
-            )
-
-        finally:
-            db_manager.delete_user(username)
+        assert time_diff_to_pack < 300, (
+            f"Timer should show pack card time (~30 min from now), "
+            f"but shows {timer_time}. "
+            f"Diff to pack: {time_diff_to_pack}s, diff to hangul: {time_diff_to_hangul}s"
+        )
+        # Also verify it's NOT showing the Hangul time
+        assert time_diff_to_hangul > 3600, (
+            f"Timer appears to show Hangul card time instead of pack card time. "
+            f"Timer: {timer_time}, expected pack time: {pack_review_time}"
+        )
 
     def test_timer_shows_hangul_when_no_packs(
         self,
         client: TestClient,
         db_manager: DbManager,
+        user_factory: UserFactory,
         test_data_dir: Path,
     ):
         """Timer should show Hangul card time when user has no pack access."""
-        username = f"_test_{uuid.uuid4().hex[:8]}"
-        password = "test123"
+        username, password_hash = user_factory()
 
-        try:
-            password_hash = db_manager.create_user(username, password)
+        user_db_path = test_data_dir / "users" / username / "learning.db"
 
-            user_db_path = test_data_dir / "users" / username / "learning.db"
+        now = datetime.now(timezone.utc)
+        hangul_review_time = now + timedelta(hours=1)
+        hangul_time_str = hangul_review_time.strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
-            now = datetime.now(timezone.utc)
-            hangul_review_time = now + timedelta(hours=1)
-            hangul_time_str = hangul_review_time.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+        # Set up Hangul card review time only (no pack setup)
+        _setup_hangul_only(db_manager, user_db_path, hangul_time_str)
 
-            # Set up Hangul card review time only (no pack setup)
-            _setup_hangul_only(user_db_path, hangul_time_str)
+        client.login(username, password_hash)
+        response = client.get("/")
+        assert response.status_code == 200
 
-            client.login(username, password_hash)
-            response = client.get("/")
-            assert response.status_code == 200
+        # Should still have a timer (from Hangul cards)
+        match = _TIMER_TARGET_RE.search(response.content)
+        assert match is not None, "Home page should render the countdown timer"
+        timer_timestamp = int(match.group(1))
+        timer_time = datetime.fromtimestamp(timer_timestamp, tz=timezone.utc)
 
-            # Should still have a timer (from Hangul cards)
-            match = re.search(r'data-target="(\d+)"', response.text)
-            if match:
-                timer_timestamp = int(match.group(1))
-                timer_time = datetime.fromtimestamp(timer_timestamp, tz=timezone.utc)
+        # Timer should be close to hangul_review_time
+        time_diff = abs((timer_time - hangul_review_time).total_seconds())
+        assert time_diff < 300, (
+            f"Timer should show Hangul card time (~1h from now), "
+            f"but shows {timer_time}"
+        )
 
-                # Timer should be close to hangul_review_time
-                time_diff = abs((timer_time - hangul_review_time).total_seconds())
-                assert time_diff < 300, (
-                    f"Timer should show Hangul card time (~1h from now), "
-                    f"but shows {timer_time}"
-                )
 
-        finally:
-            db_manager.delete_user(username)
+# Pack rows are only inserted if missing, so the script is safe to re-run
+_REGISTER_PACK_SQL = """
+BEGIN IMMEDIATE;
+INSERT INTO content_packs (id, name, pack_type, version, description, source_path, scope, installed_at, is_enabled)
+    SELECT 'test_lesson_pack', 'Test Lesson Pack', 'cards', '1.0.0', 'Test pack', 'fixtures/test_lesson_pack', 'global', datetime('now'), 1
+    WHERE NOT EXISTS (SELECT 1 FROM content_packs WHERE id = 'test_lesson_pack');
+-- Make pack public (accessible to all users)
+INSERT OR REPLACE INTO pack_permissions (pack_id, group_id, allowed)
+    VALUES ('test_lesson_pack', '', 1);
+-- One tier 5 card in lesson 1
+INSERT INTO card_definitions (front, main_answer, description, card_type, tier, is_reverse, pack_id, lesson)
+    SELECT 'L1-A', 'l1a', 'Lesson 1 card A', 'Vocabulary', 5, 0, 'test_lesson_pack', 1
+    WHERE NOT EXISTS (SELECT 1 FROM card_definitions WHERE pack_id = 'test_lesson_pack');
+COMMIT;
+"""
 
+# Tables the timer reads, plus tier 1 unlocked
+_USER_SETUP_SQL = """
+CREATE TABLE IF NOT EXISTS card_progress (
+    card_id INTEGER PRIMARY KEY,
+    ease_factor REAL DEFAULT 2.5,
+    interval_days INTEGER DEFAULT 0,
+    repetitions INTEGER DEFAULT 0,
+    next_review TEXT,
+    total_reviews INTEGER DEFAULT 0,
+    correct_reviews INTEGER DEFAULT 0,
+    learning_step INTEGER DEFAULT 0,
+    fsrs_stability REAL DEFAULT 0.0,
+    fsrs_difficulty REAL DEFAULT 0.0,
+    fsrs_state TEXT DEFAULT 'New'
+);
+CREATE TABLE IF NOT EXISTS pack_lesson_progress (
+    pack_id TEXT NOT NULL,
+    lesson INTEGER NOT NULL,
+    unlocked INTEGER NOT NULL DEFAULT 0,
+    unlocked_at TEXT,
+    PRIMARY KEY (pack_id, lesson)
+);
+INSERT OR REPLACE INTO settings (key, value) VALUES ('max_unlocked_tier', '1');
+"""
 
-def _setup_test_databases(
-    user_db_path: Path,
-    app_db_path: Path,
-    pack_time_str: str,
-    hangul_time_str: str,
-):
-    """Set up test databases with Hangul and pack cards at different review times."""
-    # 1. Register pack in app.db and make it public
-    app_conn = sqlite3.connect(app_db_path)
-    try:
-        # Check if pack already registered
-        cursor = app_conn.execute(
-            "SELECT COUNT(*) FROM content_packs WHERE id = 'test_lesson_pack'"
-        )
-        if cursor.fetchone()[0] == 0:
-            # Register the test pack with all required columns
-            app_conn.execute(
-                """INSERT INTO content_packs (id, name, pack_type, version, description, source_path, scope, installed_at, is_enabled)
-                   VALUES ('test_lesson_pack', 'Test Lesson Pack', 'cards', '1.0.0', 'Test pack', 'fixtures/test_lesson_pack', 'global', datetime('now'), 1)"""
-            )
 
-        # Make pack public (accessible to all users)
-        app_conn.execute(
-            """INSERT OR REPLACE INTO pack_permissions (pack_id, group_id, allowed)
-               VALUES ('test_lesson_pack', '', 1)"""
-        )
+def _register_test_pack(db_manager: DbManager, app_db_path: Path) -> tuple[int, int]:
+    """Register test_lesson_pack in app.db, make it public, and give it one card.
 
-        # Insert pack cards into card_definitions if not already there
-        cursor = app_conn.execute(
-            "SELECT COUNT(*) FROM card_definitions WHERE pack_id = 'test_lesson_pack'"
-        )
-        if cursor.fetchone()[0] == 0:
-            # Insert test pack cards (tier 5)
-            app_conn.execute(
-                """INSERT INTO card_definitions (front, main_answer, description, card_type, tier, is_reverse, pack_id, lesson)
-                   VALUES ('L1-A', 'l1a', 'Lesson 1 card A', 'Vocabulary', 5, 0, 'test_lesson_pack', 1)"""
-            )
+    Returns (pack_card_id, hangul_card_id).
+    """
+    app_conn = db_manager.connect(app_db_path)
+    try:
+        app_conn.executescript(_REGISTER_PACK_SQL)
 
-        # Get the pack card ID
-        cursor = app_conn.execute(
+        pack_card_id = app_conn.execute(
             "SELECT id FROM card_definitions WHERE pack_id = 'test_lesson_pack' LIMIT 1"
-        )
-        pack_card_id = cursor.fetchone()[0]
+        ).fetchone()[0]
 
         # Get a Hangul card ID (tier 1-4)
-        cursor = app_conn.execute(
+        hangul_row = app_conn.execute(
             "SELECT id FROM card_definitions WHERE pack_id IS NULL AND tier <= 4 LIMIT 1"
-        )
-        hangul_row = cursor.fetchone()
+        ).fetchone()
         hangul_card_id = hangul_row[0] if hangul_row else 1
-
-        app_conn.commit()
     finally:
         app_conn.close()
 
-    # 2. Set up card progress in user's learning.db
-    user_conn = sqlite3.connect(user_db_path)
-    try:
-        # Ensure card_progress table exists
-        user_conn.execute(
-            """CREATE TABLE IF NOT EXISTS card_progress (
-                card_id INTEGER PRIMARY KEY,
-                ease_factor REAL DEFAULT 2.5,
-                interval_days INTEGER DEFAULT 0,
-                repetitions INTEGER DEFAULT 0,
-                next_review TEXT,
-                total_reviews INTEGER DEFAULT 0,
-                correct_reviews INTEGER DEFAULT 0,
-                learning_step INTEGER DEFAULT 0,
-                fsrs_stability REAL DEFAULT 0.0,
-                fsrs_difficulty REAL DEFAULT 0.0,
-                fsrs_state TEXT DEFAULT 'New'
-            )"""
-        )
-
-        # Set Hangul card with far future review time
-        user_conn.execute(
-            """INSERT OR REPLACE INTO card_progress (card_id, next_review, repetitions, learning_step, fsrs_state)
-               VALUES (?, ?, 5, 4, 'Review')""",
-            (hangul_card_id, hangul_time_str),
-        )
-
-        # Set pack card with near future review time
-        user_conn.execute(
-            """INSERT OR REPLACE INTO card_progress (card_id, next_review, repetitions, learning_step, fsrs_state)
-               VALUES (?, ?, 3, 2, 'Learning')""",
-            (pack_card_id, pack_time_str),
-        )
+    return pack_card_id, hangul_card_id
 
-        # Ensure tier 1 is unlocked
-        user_conn.execute(
-            """INSERT OR REPLACE INTO settings (key, value)
-               VALUES ('max_unlocked_tier', '1')"""
-        )
 
-        # Unlock lesson 1 of the test pack
-        user_conn.execute(
-            """CREATE TABLE IF NOT EXISTS pack_lesson_progress (
-                pack_id TEXT NOT NULL,
-                lesson INTEGER NOT NULL,
-                unlocked INTEGER NOT NULL DEFAULT 0,
-                unlocked_at TEXT,
-                PRIMARY KEY (pack_id, lesson)
-            )"""
-        )
-        user_conn.execute(
-            """INSERT OR REPLACE INTO pack_lesson_progress (pack_id, lesson, unlocked, unlocked_at)
-               VALUES ('test_lesson_pack', 1, 1, datetime('now'))"""
-        )
+def _write_user_progress(
+    db_manager: DbManager,
+    user_db_path: Path,
+    progress: list[tuple[int, str, int, int, str]],
+    unlock_pack_lesson: bool = False,
+):
+    """Write card_progress rows in one transaction.
 
-        user_conn.commit()
+    Each row is (card_id, next_review, repetitions, learning_step, fsrs_state).
+    """
+    user_conn = db_manager.connect(user_db_path)
+    try:
+        user_conn.executescript(_USER_SETUP_SQL)
+        with user_conn:
+            user_conn.executemany(
+                """INSERT OR REPLACE INTO card_progress (card_id, next_review, repetitions, learning_step, fsrs_state)
+                   VALUES (?, ?, ?, ?, ?)""",
+                progress,
+            )
+            if unlock_pack_lesson:
+                user_conn.execute(
+                    """INSERT OR REPLACE INTO pack_lesson_progress (pack_id, lesson, unlocked, unlocked_at)
+                       VALUES ('test_lesson_pack', 1, 1, datetime('now'))"""
+                )
     finally:
         user_conn.close()
 
 
-def _setup_hangul_only(user_db_path: Path, hangul_time_str: str):
+def _setup_user_progress(
+    db_manager: DbManager,
+    user_db_path: Path,
+    pack_card_id: int,
+    pack_time_str: str,
+    hangul_card_id: int,
+    hangul_time_str: str,
+):
+    """Set the user's Hangul and pack cards to different review times."""
+    _write_user_progress(
+        db_manager,
+        user_db_path,
+        [
+            # Hangul card with far future review time
+            (hangul_card_id, hangul_time_str, 5, 4, "Review"),
+            # Pack card with near future review time
+            (pack_card_id, pack_time_str, 3, 2, "Learning"),
+        ],
+        unlock_pack_lesson=True,
+    )
+
+
+def _setup_hangul_only(db_manager: DbManager, user_db_path: Path, hangul_time_str: str):
     """Set up user database with only Hangul card progress."""
-    user_conn = sqlite3.connect(user_db_path)
-    try:
-        user_conn.execute(
-            """CREATE TABLE IF NOT EXISTS card_progress (
-                card_id INTEGER PRIMARY KEY,
-                ease_factor REAL DEFAULT 2.5,
-                interval_days INTEGER DEFAULT 0,
-                repetitions INTEGER DEFAULT 0,
-                next_review TEXT,
-                total_reviews INTEGER DEFAULT 0,
-                correct_reviews INTEGER DEFAULT 0,
-                learning_step INTEGER DEFAULT 0,
-                fsrs_stability REAL DEFAULT 0.0,
-                fsrs_difficulty REAL DEFAULT 0.0,
-                fsrs_state TEXT DEFAULT 'New'
-            )"""
-        )
-
-        # Set Hangul card (ID 1) with future review time
-        user_conn.execute(
-            """INSERT OR REPLACE INTO card_progress (card_id, next_review, repetitions, learning_step, fsrs_state)
-               VALUES (1, ?, 5, 4, 'Review')""",
-            (hangul_time_str,),
-        )
-
-        # Ensure tier 1 is unlocked
-        user_conn.execute(
-            """INSERT OR REPLACE INTO settings (key, value)
-               VALUES ('max_unlocked_tier', '1')"""
-        )
-
-        user_conn.commit()
-    finally:
-        user_conn.close()
+    # Hangul card (ID 1) with future review time
+    _write_user_progress(db_manager, user_db_path, [(1, hangul_time_str, 5, 4, "Review")])
@@ -10,14 +10,20 @@ import pytest
 from conftest import TestClient
 
 
-def test_vocabulary_directory_format_loads(admin_client: TestClient):
-    """Vocabulary should load from vocabulary/ directory with lesson_*.json files."""
-    # Enable the directory-format pack (admin can enable packs)
-    response = admin_client.post("/settings/pack/test_vocab_directory_pack/enable")
+@pytest.fixture(scope="module")
+def vocab_directory_pack_enabled(shared_admin_client: TestClient) -> str:
+    """Enable the directory-format pack once per module. Returns the pack ID."""
+    pack_id = "test_vocab_directory_pack"
+    response = shared_admin_client.post(f"/settings/pack/{pack_id}/enable")
     assert response.status_code in (200, 303), f"Failed to enable pack: {response.status_code}"
+    return pack_id
+
 
-    # Try to load vocabulary page
-    response = admin_client.get("/library/vocabulary")
+def test_vocabulary_directory_format_loads(
+    shared_admin_client: TestClient, vocab_directory_pack_enabled: str
+):
+    """Vocabulary should load from vocabulary/ directory with lesson_*.json files."""
+    response = shared_admin_client.get("/library/vocabulary")
     assert response.status_code == 200
 
     # Should NOT show "Pack Not Enabled" message